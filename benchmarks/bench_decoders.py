@@ -0,0 +1,67 @@
+"""
+Compare json backends decoding recorded stats.nba.com responses.
+
+    python benchmarks/bench_decoders.py --cassette season.db
+    python benchmarks/bench_decoders.py --rows 20000
+
+Without a cassette, synthetic payloads from nba.server are used. The package is imported from
+this checkout, so it does not need to be installed.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nba import decoders
+from nba.server import synthetic_stats
+
+
+def load_bodies(cassette_path, rows):
+    if cassette_path:
+        from nba.cassette import Cassette
+
+        cassette = Cassette(cassette_path)
+        return [cassette.play(key).content for key in cassette.keys()]
+    return [
+        json.dumps(synthetic_stats("leaguedashplayerstats", rows, 1)).encode("utf-8"),
+        json.dumps(synthetic_stats("boxscoresummaryv2", rows // 100 or 1, 10)).encode(
+            "utf-8"
+        ),
+    ]
+
+
+def bench(loads, bodies, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in bodies:
+            loads(body)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cassette", default=None, help="recorded responses to decode")
+    parser.add_argument("--rows", type=int, default=20000, help="rows per synthetic payload")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    bodies = load_bodies(args.cassette, args.rows)
+    total_mb = sum(len(body) for body in bodies) / 2.0 ** 20
+    print("%d responses, %.1f MB" % (len(bodies), total_mb))
+    baseline = None
+    for name in reversed(decoders.available()):
+        elapsed = bench(decoders.get_decoder(name), bodies, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            "%-10s %8.1f ms %8.1f MB/s %6.2fx"
+            % (name, elapsed * 1000, total_mb / elapsed, baseline / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare building frames from rowSets row by row in pandas against the columnar builder.
+
+    python benchmarks/bench_frames.py --cassette season.db
+    python benchmarks/bench_frames.py --rows 200000
+
+Without a cassette, synthetic payloads from nba.server are used. The package is imported from
+this checkout, so it does not need to be installed.
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nba import decoders
+from nba.frames import build_frame
+from nba.server import synthetic_stats
+
+
+def load_result_sets(cassette_path, rows):
+    if cassette_path:
+        from nba.cassette import Cassette
+
+        cassette = Cassette(cassette_path)
+        payloads = [decoders.loads(cassette.play(key).content) for key in cassette.keys()]
+    else:
+        payloads = [synthetic_stats("playergamelogs", rows, 1)]
+    result_sets = []
+    for payload in payloads:
+        sets = payload.get("resultSets", payload.get("resultSet", []))
+        for result_set in sets if isinstance(sets, list) else [sets]:
+            if result_set.get("rowSet"):
+                headers = [h.lower() for h in result_set["headers"]]
+                result_sets.append((headers, result_set["rowSet"]))
+    return result_sets
+
+
+def rows_frame(headers, rows):
+    return pd.DataFrame(rows, columns=headers)
+
+
+def bench(build, result_sets, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for headers, rows in result_sets:
+            build(headers, rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cassette", default=None, help="recorded responses to build frames from")
+    parser.add_argument("--rows", type=int, default=200000, help="rows of the synthetic result set")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    result_sets = load_result_sets(args.cassette, args.rows)
+    total_rows = sum(len(rows) for _, rows in result_sets)
+    print("%d result sets, %d rows" % (len(result_sets), total_rows))
+    baseline = None
+    for name, build in (("rows", rows_frame), ("columnar", build_frame)):
+        elapsed = bench(build, result_sets, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            "%-10s %8.1f ms %10.0f rows/s %6.2fx"
+            % (name, elapsed * 1000, total_rows / elapsed, baseline / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from .apiclient import APIClient
+from .asyncclient import AsyncAPIClient
 from .exceptions import ApiError
 
 
@@ -3,8 +3,8 @@ from nba import endpoints
 
 
 class APIClient(BaseClient):
-    def __init__(self):
-        super(APIClient, self).__init__()
+    def __init__(self, **kwargs):
+        super(APIClient, self).__init__(**kwargs)
 
         self.boxscores = endpoints.Boxscores(self)
         self.common = endpoints.Common(self)
@@ -0,0 +1,116 @@
+import asyncio
+import contextvars
+import functools
+
+from nba.baseclient import BaseClient
+from nba import deadlines, endpoints, scheduler
+
+
+class AsyncEndpoint(object):
+    def __init__(self, endpoint):
+        """
+        :param endpoint: synchronous endpoint whose methods will be awaitable.
+        """
+        self.endpoint = endpoint
+
+    def __getattr__(self, name):
+        attr = getattr(self.endpoint, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self.endpoint.client.run(attr, *args, **kwargs)
+
+        return call
+
+
+class AsyncAPIClient(BaseClient):
+    def __init__(self, max_workers=32, **kwargs):
+        """
+        :param max_workers: maximum number of requests in flight at once.
+        """
+        super(AsyncAPIClient, self).__init__(max_workers=max_workers, **kwargs)
+
+        self.boxscores = AsyncEndpoint(endpoints.Boxscores(self))
+        self.common = AsyncEndpoint(endpoints.Common(self))
+        self.draft = AsyncEndpoint(endpoints.Draft(self))
+        self.events = AsyncEndpoint(endpoints.Events(self))
+        self.homepage = AsyncEndpoint(endpoints.Homepage(self))
+        self.misc = AsyncEndpoint(endpoints.Misc(self))
+        self.playbyplay = AsyncEndpoint(endpoints.PlayByPlay(self))
+        self.player = AsyncEndpoint(endpoints.Player(self))
+        self.scoreboard = AsyncEndpoint(endpoints.Scoreboard(self))
+        self.team = AsyncEndpoint(endpoints.Team(self))
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run a blocking endpoint call on the client executor without blocking the event loop,
+        carrying over the current context so deadlines apply to the call.
+
+        :param func: endpoint method to call.
+        :returns: result of the endpoint method.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(context.run, self.controlled, func, *args, **kwargs),
+        )
+
+    async def fetch_many(
+        self, calls, max_workers=None, as_completed=False, deadline=None, priority=None
+    ):
+        """
+        Await many endpoint calls concurrently, bounding how many are in flight.
+
+        :param calls: (awaitable endpoint method, kwargs) pairs, e.g. (client.boxscores.advanced, {"game_id": gid, "idx_data": 0}).
+        :type calls: iterable
+        :param max_workers: maximum number of calls in flight at once, defaults to the executor size.
+        :type max_workers: int
+        :param as_completed: return an async generator of (index, result) pairs as calls finish.
+        :type as_completed: bool
+        :param deadline: seconds the whole batch must finish in, shared by every call in it.
+        :type deadline: float
+        :param priority: priority class of every call in the batch, e.g. nba.scheduler.BACKFILL,
+            used when the client rate limiter is a nba.scheduler.PriorityScheduler.
+        :type priority: int
+        :returns: results in the same order as calls, or an async generator of (index, result) pairs.
+        :rtype: list
+
+        """
+        semaphore = asyncio.Semaphore(max_workers or self.max_workers)
+
+        async def bounded(idx, method, kwargs):
+            async with semaphore:
+                return idx, await method(**kwargs)
+
+        with deadlines.deadline(deadline), scheduler.priority(priority):
+            tasks = [
+                asyncio.ensure_future(bounded(idx, method, kwargs))
+                for idx, (method, kwargs) in enumerate(calls)
+            ]
+        if as_completed:
+            return self._fetch_as_completed(tasks)
+        try:
+            return [result for _, result in await asyncio.gather(*tasks)]
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    @staticmethod
+    async def _fetch_as_completed(tasks):
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # shutting down waits for in flight calls, keep it off the event loop.
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
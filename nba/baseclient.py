@@ -1,14 +1,240 @@
-import requests
-from requests.adapters import HTTPAdapter
+import contextvars
+import concurrent.futures
+
+from nba import deadlines, decoders, scheduler, streaming
+from nba.circuitbreaker import CircuitBreakers
+from nba.compression import accept_encoding, TransferStats
+from nba.exceptions import DeadlineExceeded
+from nba.hedging import HedgePolicy
+from nba.hooks import Hooks
+from nba.metrics import ClientMetrics
+from nba.cache import MemoryCache, TTLPolicy
+from nba.retry import RetryPolicy
+from nba.schemas import SchemaRegistry
+from nba.sessions import SessionRegistry
+from nba.singleflight import SingleFlight
 
 
 class BaseClient(object):
-    def __init__(self):
+    def __init__(
+        self,
+        cache=None,
+        rate_limiter=None,
+        concurrency=None,
+        retry=None,
+        timeout=(3.05, 30),
+        timeouts=None,
+        sessions=None,
+        coalesce=True,
+        cassette=None,
+        stream=False,
+        json_decoder="auto",
+        hooks=None,
+        metrics=None,
+        breakers=None,
+        hedge=None,
+        compact=False,
+        max_workers=None,
+    ):
+        """
+        :param cache: response cache consulted before each request, defaults to a 16 entry
+            nba.cache.MemoryCache owned by this client expiring entries per nba.cache.TTLPolicy,
+            so live scoreboards and games in progress refresh. Pass False to disable caching.
+        :param rate_limiter: limiter consulted before every HTTP call, e.g. nba.ratelimit.TokenBucket.
+        :param concurrency: controller bounding calls in flight on the bulk and async paths,
+            e.g. nba.concurrency.AIMDController.
+        :param retry: policy for retrying failed requests, defaults to a nba.retry.RetryPolicy
+            with its own retry budget.
+        :param timeout: default (connect, read) timeout in seconds for every HTTP call, a single
+            number for both, or None to wait indefinitely.
+        :param timeouts: (connect, read) timeouts overriding the default, keyed by stats.nba.com
+            method, e.g. {"shotchartdetail": (3.05, 120)}, or by full url for other hosts.
+        :param sessions: registry handing out pooled keep-alive sessions per host,
+            defaults to a nba.sessions.SessionRegistry pooling max_workers connections per host.
+        :param coalesce: share one HTTP call between concurrent identical requests.
+        :param cassette: nba.cassette.Cassette recording every raw response, or replaying them without network.
+        :param stream: parse stats.nba.com payloads incrementally into columns, requires ijson.
+            True streams every stats method, or pass the method names to stream, e.g. {"shotchartdetail"}.
+        :param json_decoder: json backend, one of orjson, simdjson, ujson, json, or auto for the
+            fastest one installed.
+        :param hooks: nba.hooks.Hooks notified with the timing of each stage of every call.
+        :param metrics: nba.metrics.ClientMetrics fed from the hooks, or True for a new one.
+        :param breakers: nba.circuitbreaker.CircuitBreakers failing calls fast while a host is down,
+            or True for breakers with the default thresholds.
+        :param hedge: nba.hedging.HedgePolicy duplicating requests slower than recent ones,
+            or True to hedge every stats.nba.com method at their 95th latency percentile.
+        :param compact: convert frames to compact dtypes, int32 ids, float32 stats and categorical
+            labels. True uses a default nba.schemas.SchemaRegistry, or pass a configured one.
+        :param max_workers: size of the thread pool shared by every fetch_many call, defaults to 8
+            or to the maximum window of the client concurrency controller. The default session
+            registry keeps as many connections alive per host.
+        """
         self.url = "http://stats.nba.com/stats/"
-        self.session = requests.Session()
-        self.session.mount("http://stats.nba.com", HTTPAdapter(max_retries=1))
+        self.global_url = "http://uk.global.nba.com/stats2/"
+        self.cms_url = "http://stats-prod.nba.com/wp-json/statscms/v1/"
+        self.cache = MemoryCache(ttl_policy=TTLPolicy()) if cache is None else (cache or None)
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        if max_workers is None:
+            max_workers = concurrency.maximum if concurrency else 8
+        self.max_workers = max_workers
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="nba"
+        )
+        self.sessions = sessions or SessionRegistry(pool_maxsize=max_workers)
+        self.singleflight = SingleFlight() if coalesce else None
+        self.cassette = cassette
+        if stream and not streaming.available:
+            raise ImportError("stream requires the ijson package, pip install nba[stream]")
+        self.stream = stream
+        self.json_loads = decoders.get_decoder(json_decoder)
+        self.transfer = TransferStats()
+        self.hooks = hooks or Hooks()
+        self.collector = ClientMetrics() if metrics is True else (metrics or None)
+        if self.collector is not None:
+            self.hooks.register(self.collector)
+        self.breakers = CircuitBreakers() if breakers is True else (breakers or None)
+        self.hedge = HedgePolicy() if hedge is True else (hedge or None)
+        self._owns_hedge = hedge is True
+        self.schemas = SchemaRegistry() if compact is True else (compact or None)
         self.current_season = "2019-20"
 
+    @property
+    def session(self):
+        """Requests session for stats.nba.com on the calling thread."""
+        return self.sessions.session_for(self.url)
+
+    @session.setter
+    def session(self, session):
+        self.sessions.set_session(self.url, session)
+
+    def timeout_for(self, method):
+        """
+        :param method: stats.nba.com method, or full url for other hosts.
+        :returns: (connect, read) timeout to use for the call, None where there is no limit.
+        :rtype: tuple
+        """
+        timeout = self.timeouts.get(method, self.timeout)
+        if timeout is None or isinstance(timeout, (int, float)):
+            return (timeout, timeout)
+        return tuple(timeout)
+
+    def streams(self, method):
+        """
+        :param method: stats.nba.com method, None for calls to other hosts.
+        :returns: whether the payload of the method is parsed incrementally.
+        :rtype: bool
+        """
+        if method is None or not self.stream:
+            return False
+        return self.stream is True or method in self.stream
+
+    def metrics(self):
+        """
+        :returns: the client metrics in the Prometheus text exposition format.
+        :rtype: str
+        """
+        if self.collector is None:
+            raise ValueError("client was created without metrics")
+        return self.collector.render()
+
+    def fetch_many(
+        self, calls, max_workers=None, as_completed=False, deadline=None, priority=None
+    ):
+        """
+        Run many endpoint calls concurrently on the client thread pool.
+
+        :param calls: (endpoint method, kwargs) pairs, e.g. (client.boxscores.advanced, {"game_id": gid, "idx_data": 0}).
+        :type calls: iterable
+        :param max_workers: maximum number of calls of the batch in flight at once, defaults to
+            the size of the client thread pool. With a client concurrency controller the calls in
+            flight are tuned within it.
+        :type max_workers: int
+        :param as_completed: yield (index, result) pairs as calls finish rather than returning results in input order.
+        :type as_completed: bool
+        :param deadline: seconds the whole batch must finish in, shared by every call in it.
+        :type deadline: float
+        :param priority: priority class of every call in the batch, e.g. nba.scheduler.BACKFILL,
+            used when the client rate limiter is a nba.scheduler.PriorityScheduler.
+        :type priority: int
+        :returns: results in the same order as calls, or a generator of (index, result) pairs.
+        :rtype: list
+
+        """
+        with deadlines.deadline(deadline), scheduler.priority(priority):
+            calls = [
+                (contextvars.copy_context(), method, kwargs) for method, kwargs in calls
+            ]
+        max_workers = min(max_workers or self.max_workers, self.max_workers)
+        if as_completed:
+            return self._fetch_as_completed(calls, max_workers)
+        results = [None] * len(calls)
+        for idx, result in self._fetch_as_completed(calls, max_workers):
+            results[idx] = result
+        return results
+
+    def controlled(self, func, *args, **kwargs):
+        """
+        Call func holding a slot of the client concurrency controller, if one is set.
+
+        :param func: endpoint method to call.
+        :returns: result of the endpoint method.
+        :raises: DeadlineExceeded if no slot frees up before the current deadline.
+        """
+        if self.concurrency is None:
+            return func(*args, **kwargs)
+        if not self.concurrency.acquire(timeout=deadlines.check()):
+            name = getattr(func, "__name__", func)
+            raise DeadlineExceeded("no concurrency slot free before deadline for %s" % name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.concurrency.release()
+
+    def _fetch_as_completed(self, calls, max_workers):
+        # keep at most max_workers calls of the batch queued on the shared pool.
+        pending = iter(enumerate(calls))
+        running = {}
+
+        def fill():
+            for idx, (context, method, kwargs) in pending:
+                future = self.executor.submit(context.run, self.controlled, method, **kwargs)
+                running[future] = idx
+                if len(running) >= max_workers:
+                    return
+
+        try:
+            fill()
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield running.pop(future), future.result()
+                fill()
+        finally:
+            for future in running:
+                future.cancel()
+
+    def close(self):
+        """
+        Wait for in flight calls, then release the thread pool, the pooled connections
+        and the hedging threads of a hedge policy the client created.
+        """
+        self.executor.shutdown(wait=True)
+        self.sessions.close()
+        if self._owns_hedge:
+            self.hedge.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @property
     def headers(self):
         """Set headers to be used in API requests."""
@@ -22,7 +248,7 @@ class BaseClient(object):
             "Host": "stats.nba.com",
             "Cache-Control": "max-age=0",
             "Connection": "keep-alive",
-            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Encoding": accept_encoding(),
             "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
             "x-nba-stats-origin": "stats",
             "x-nba-stats-token": "true",
@@ -0,0 +1,269 @@
+import datetime
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from nba import decoders
+from nba.utils import ThreadConnection
+
+
+FOREVER = None
+
+
+def cache_key(request_url, params):
+    """
+    Build a stable cache key from the request url and its params.
+
+    :param request_url: url the request is sent to.
+    :type request_url: str
+    :param params: params sent with the request.
+    :type params: dict
+    :returns: key identifying the response.
+    :rtype: str
+
+    """
+    return "%s?%s" % (
+        request_url,
+        json.dumps(params, sort_keys=True, separators=(",", ":"), default=str),
+    )
+
+
+def season_completed(game_id, today=None):
+    """
+    Check whether the season a game belongs to has finished, game ids encode the season start year.
+
+    :param game_id: ID of the game, e.g. 0021900001 for the 2019-20 season.
+    :type game_id: str
+    :param today: reference date, defaults to today.
+    :type today: datetime.date
+    :returns: True once the season and its playoffs are over.
+    :rtype: bool
+
+    """
+    today = today or datetime.date.today()
+    try:
+        start_year = 2000 + int(str(game_id)[3:5])
+    except ValueError:
+        return False
+    if start_year > today.year:
+        start_year -= 100
+    return today >= datetime.date(start_year + 1, 10, 1)
+
+
+def _game_ttl(params):
+    if season_completed(params.get("GameID", "")):
+        return FOREVER
+    return 60
+
+
+def _scoreboard_ttl(params):
+    try:
+        game_date = datetime.datetime.strptime(params["GameDate"], "%Y-%m-%d").date()
+    except (KeyError, TypeError, ValueError):
+        return 10
+    if game_date < datetime.date.today() - datetime.timedelta(days=1):
+        return FOREVER
+    return 10
+
+
+DEFAULT_TTLS = {
+    "boxscoreadvancedv2": _game_ttl,
+    "boxscorefourfactorsv2": _game_ttl,
+    "boxscoremiscv2": _game_ttl,
+    "boxscoreplayertrackv2": _game_ttl,
+    "boxscorescoringv2": _game_ttl,
+    "boxscoresummaryv2": _game_ttl,
+    "boxscoretraditionalv2": _game_ttl,
+    "boxscoreusagev2": _game_ttl,
+    "draftcombinedrillresults": FOREVER,
+    "draftcombinenonstationaryshooting": FOREVER,
+    "draftcombineplayeranthro": FOREVER,
+    "draftcombinespotshooting": FOREVER,
+    "draftcombinestats": FOREVER,
+    "drafthistory": FOREVER,
+    "franchisehistory": FOREVER,
+    "playbyplayv2": _game_ttl,
+    "scoreboardV2": _scoreboard_ttl,
+}
+
+
+class TTLPolicy(object):
+    def __init__(self, default=3600, ttls=None):
+        """
+        Decide how long responses from each stats.nba.com method stay cached.
+
+        :param default: ttl in seconds for methods without their own entry.
+        :type default: float
+        :param ttls: method name to ttl in seconds, or to a callable taking the request params.
+            A ttl of FOREVER (None) never expires, 0 disables caching.
+        :type ttls: dict
+
+        """
+        self.default = default
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+
+    def __call__(self, method, params):
+        ttl = self.ttls.get(method, self.default)
+        if callable(ttl):
+            ttl = ttl(params or {})
+        return ttl
+
+
+class MemoryCache(object):
+    def __init__(self, max_entries=16, max_bytes=None, ttl=FOREVER, ttl_policy=None):
+        """
+        In memory LRU response cache owned by a single client.
+
+        :param max_entries: maximum number of responses held, None for no limit.
+        :type max_entries: int
+        :param max_bytes: maximum total size of held responses in bytes, None for no limit.
+        :type max_bytes: int
+        :param ttl: seconds a response stays valid, FOREVER (None) never expires.
+        :type ttl: float
+        :param ttl_policy: callable taking (method, params) returning a ttl, overrides ttl.
+        :type ttl_policy: nba.cache.TTLPolicy
+
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.ttl_policy = ttl_policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def entries(self):
+        """Number of responses currently held."""
+        return len(self._data)
+
+    def get(self, key):
+        """
+        :param key: cache key of the response.
+        :returns: cached response json, None if missing or expired.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[2] is not None and item[2] < time.time():
+                self._remove(key)
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key, value, method=None, params=None, size=None):
+        """
+        :param key: cache key of the response.
+        :param value: response json to store.
+        :param method: stats.nba.com method, used to look up the ttl.
+        :param params: params sent with the request, used to look up the ttl.
+        :param size: size of the response in bytes, estimated from the json when not given.
+        """
+        ttl = self.ttl_policy(method, params) if self.ttl_policy else self.ttl
+        if ttl == 0 or self.max_entries == 0:
+            return
+        if size is None:
+            size = len(json.dumps(value, separators=(",", ":")))
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires = None if ttl is FOREVER else time.time() + ttl
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, expires)
+            self.nbytes += size
+            while (
+                self.max_entries is not None and len(self._data) > self.max_entries
+            ) or (self.max_bytes is not None and self.nbytes > self.max_bytes):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, size, _ = self._data.pop(key)
+        self.nbytes -= size
+
+    def clear(self):
+        """Drop every held response, counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+
+class SQLiteCache(object):
+    _connection = ThreadConnection()
+
+    def __init__(self, path, ttl_policy=None):
+        """
+        Persistent response cache stored in a SQLite database, safe to share between threads and processes.
+
+        :param path: location of the database file.
+        :type path: str
+        :param ttl_policy: callable taking (method, params) returning a ttl in seconds.
+        :type ttl_policy: nba.cache.TTLPolicy
+
+        """
+        self.path = path
+        self.ttl_policy = ttl_policy or TTLPolicy()
+        self.hits = 0
+        self.misses = 0
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, method TEXT, value BLOB, expires REAL, created REAL)"
+        )
+
+    def get(self, key):
+        """
+        :param key: cache key of the response.
+        :returns: cached response json, None if missing or expired.
+        """
+        row = self._connection.execute(
+            "SELECT value, expires FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None and row[1] is not None and row[1] < time.time():
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decoders.loads(zlib.decompress(row[0]))
+
+    def set(self, key, value, method=None, params=None, size=None):
+        """
+        :param key: cache key of the response.
+        :param value: response json to store.
+        :param method: stats.nba.com method, used to look up the ttl.
+        :param params: params sent with the request, used to look up the ttl.
+        :param size: unused, accepted for compatibility with MemoryCache.
+        """
+        ttl = self.ttl_policy(method, params)
+        if ttl == 0:
+            return
+        now = time.time()
+        expires = None if ttl is FOREVER else now + ttl
+        blob = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, method, value, expires, created) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, method, sqlite3.Binary(blob), expires, now),
+        )
+
+    def purge(self):
+        """Delete every expired response from the database."""
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires IS NOT NULL AND expires < ?",
+            (time.time(),),
+        )
+
+    def clear(self):
+        """Delete every response from the database."""
+        self._connection.execute("DELETE FROM responses")
@@ -0,0 +1,87 @@
+import json
+import sqlite3
+import time
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from nba.exceptions import CassetteMiss
+from nba.utils import ThreadConnection
+
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class Cassette(object):
+    _connection = ThreadConnection()
+
+    def __init__(self, path, mode=REPLAY):
+        """
+        Corpus of raw responses on disk, recorded from live runs and replayed without network.
+
+        :param path: location of the SQLite file holding the responses.
+        :type path: str
+        :param mode: RECORD to store every response received, REPLAY to serve stored responses only.
+        :type mode: str
+
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError("mode must be %r or %r" % (RECORD, REPLAY))
+        self.path = path
+        self.mode = mode
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT, body BLOB, recorded REAL)"
+        )
+
+    @property
+    def replaying(self):
+        return self.mode == REPLAY
+
+    def record(self, key, response):
+        """
+        :param key: key identifying the request, see nba.cache.cache_key.
+        :param response: response received for the request.
+        """
+        headers = {"Content-Type": response.headers.get("Content-Type", "")}
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, url, status, headers, body, recorded) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                response.url,
+                response.status_code,
+                json.dumps(headers),
+                sqlite3.Binary(zlib.compress(response.content)),
+                time.time(),
+            ),
+        )
+
+    def play(self, key):
+        """
+        :param key: key identifying the request, see nba.cache.cache_key.
+        :returns: the recorded response.
+        :rtype: requests.Response
+        :raises: CassetteMiss if the request was never recorded.
+        """
+        row = self._connection.execute(
+            "SELECT url, status, headers, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise CassetteMiss("no recorded response for %s" % key)
+        url, status, headers, body = row
+        response = requests.Response()
+        response.url = url
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = zlib.decompress(body)
+        return response
+
+    def keys(self):
+        """
+        :returns: keys of every recorded response.
+        :rtype: list
+        """
+        return [row[0] for row in self._connection.execute("SELECT key FROM responses")]
@@ -0,0 +1,163 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+from nba.exceptions import CircuitOpen
+from nba.utils import status_matches
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+FAILURE_STATUS_CODES = ("5xx",)
+
+
+class CircuitBreaker(object):
+    def __init__(
+        self,
+        host,
+        failure_threshold=5,
+        recovery_timeout=30.0,
+        half_open_calls=1,
+        failure_status_codes=FAILURE_STATUS_CODES,
+    ):
+        """
+        Stop calling a host after repeated failures, then let a few trial calls through once it had time to recover.
+
+        :param host: host guarded by the breaker.
+        :type host: str
+        :param failure_threshold: consecutive failures that open the circuit.
+        :type failure_threshold: int
+        :param recovery_timeout: seconds the circuit stays open before trial calls are let through.
+        :type recovery_timeout: float
+        :param half_open_calls: trial calls allowed at once while half-open.
+        :type half_open_calls: int
+        :param failure_status_codes: status codes counted as failures, either ints or classes like "5xx".
+            Timeouts and connection errors always count.
+        :type failure_status_codes: tuple
+
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.failure_status_codes = failure_status_codes
+        self.failures = 0
+        self.rejected = 0
+        self._state = CLOSED
+        self._opened_at = None
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """One of closed, open or half-open."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now):
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._trials = 0
+        return self._state
+
+    def before_call(self):
+        """
+        Reserve the right to call the host, a trial slot when half-open.
+
+        :raises: nba.exceptions.CircuitOpen when the host is not being called.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self._opened_at + self.recovery_timeout - now)
+        raise CircuitOpen(self.host, retry_in)
+
+    def is_failure(self, status_code):
+        """
+        :param status_code: response status code.
+        :returns: whether the status code counts against the host.
+        :rtype: bool
+        """
+        return status_matches(status_code, self.failure_status_codes)
+
+    def record(self, success):
+        """
+        Record the outcome of a call let through by before_call.
+
+        :param success: whether the host answered properly.
+        :type success: bool
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+            if success:
+                self.failures = 0
+                if state == HALF_OPEN:
+                    self._state = CLOSED
+                return
+            self.failures += 1
+            if state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def cancel(self):
+        """Give back a call let through by before_call that never reached the host."""
+        with self._lock:
+            if self._current_state(time.monotonic()) == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+
+    def reset(self):
+        """Close the circuit and forget past failures."""
+        with self._lock:
+            self._state = CLOSED
+            self.failures = 0
+            self._trials = 0
+
+
+class CircuitBreakers(object):
+    def __init__(self, hosts=None, **defaults):
+        """
+        One circuit breaker per host, so an outage of one host leaves calls to the others alone.
+
+        :param hosts: per host overrides of the breaker settings,
+            e.g. {"stats.nba.com": {"failure_threshold": 10}}.
+        :type hosts: dict
+        :param defaults: settings of every breaker, see nba.circuitbreaker.CircuitBreaker.
+
+        """
+        self.defaults = defaults
+        self.hosts = hosts or {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, url):
+        """
+        :param url: url about to be requested.
+        :returns: breaker guarding the url host.
+        :rtype: nba.circuitbreaker.CircuitBreaker
+        """
+        host = urlparse(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(host)
+                if breaker is None:
+                    settings = dict(self.defaults, **self.hosts.get(host, {}))
+                    breaker = self._breakers[host] = CircuitBreaker(host, **settings)
+        return breaker
+
+    def states(self):
+        """
+        :returns: state of every breaker, keyed by host.
+        :rtype: dict
+        """
+        return dict((host, breaker.state) for host, breaker in list(self._breakers.items()))
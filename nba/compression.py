@@ -0,0 +1,54 @@
+import threading
+
+try:
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    ACCEPT_ENCODING = "gzip,deflate"
+
+
+def accept_encoding():
+    """
+    Content codings urllib3 can decode in this environment, br and zstd only appear when their
+    decoder packages are installed.
+
+    :returns: value for the Accept-Encoding header.
+    :rtype: str
+    """
+    return ", ".join(coding.strip() for coding in ACCEPT_ENCODING.split(","))
+
+
+class TransferStats(object):
+    def __init__(self):
+        """
+        Bytes received on the wire against bytes after decompression, per content coding.
+        """
+        self.encodings = {}
+        self._lock = threading.Lock()
+
+    def record(self, encoding, wire_bytes, decoded_bytes):
+        """
+        :param encoding: Content-Encoding of the response, identity when not compressed.
+        :param wire_bytes: bytes read from the socket.
+        :param decoded_bytes: bytes after decompression.
+        """
+        with self._lock:
+            stats = self.encodings.setdefault(
+                encoding, {"responses": 0, "wire_bytes": 0, "decoded_bytes": 0}
+            )
+            stats["responses"] += 1
+            stats["wire_bytes"] += wire_bytes
+            stats["decoded_bytes"] += decoded_bytes
+
+    @property
+    def wire_bytes(self):
+        return sum(stats["wire_bytes"] for stats in self.encodings.values())
+
+    @property
+    def decoded_bytes(self):
+        return sum(stats["decoded_bytes"] for stats in self.encodings.values())
+
+    @property
+    def ratio(self):
+        """Decoded bytes per wire byte across every response, None before any response."""
+        wire_bytes = self.wire_bytes
+        return self.decoded_bytes / float(wire_bytes) if wire_bytes else None
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import deque
+
+
+class AIMDController(object):
+    def __init__(
+        self,
+        initial=4,
+        minimum=1,
+        maximum=64,
+        increase=1.0,
+        decrease=0.5,
+        latency_tolerance=1.5,
+        history_size=256,
+    ):
+        """
+        Concurrency limit tuned by additive increase / multiplicative decrease.
+
+        The window grows by roughly `increase` per window of successful calls while
+        latency stays within `latency_tolerance` of its baseline, and is multiplied by
+        `decrease` whenever a call is throttled or times out.
+
+        :param initial: starting number of calls allowed in flight.
+        :type initial: int
+        :param minimum: lowest the window can shrink to.
+        :type minimum: int
+        :param maximum: highest the window can grow to.
+        :type maximum: int
+        :param increase: window growth per full window of successful calls.
+        :type increase: float
+        :param decrease: factor applied to the window on throttling.
+        :type decrease: float
+        :param latency_tolerance: latency relative to baseline above which the window stops growing.
+        :type latency_tolerance: float
+        :param history_size: number of window changes kept in history.
+        :type history_size: int
+
+        """
+        self.window = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.baseline = None
+        self.in_flight = 0
+        self.history = deque(maxlen=history_size)
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        """Number of calls currently allowed in flight."""
+        return max(self.minimum, int(self.window))
+
+    def acquire(self, timeout=None):
+        """
+        Block until a call slot is free within the current window.
+
+        :param timeout: maximum seconds to wait, None waits indefinitely.
+        :returns: whether a slot was taken before the timeout.
+        :rtype: bool
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self.in_flight >= self.limit:
+                if end is None:
+                    self._condition.wait()
+                    continue
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self.in_flight += 1
+            return True
+
+    def release(self):
+        """Return a call slot."""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def record(self, latency, throttled=False):
+        """
+        Feed the outcome of one HTTP call back into the controller.
+
+        :param latency: seconds the call took.
+        :type latency: float
+        :param throttled: whether the call was throttled, rejected or timed out.
+        :type throttled: bool
+        """
+        with self._condition:
+            now = time.monotonic()
+            if throttled:
+                # one congestion event usually fails every call in flight, only back off once per event.
+                if now - self._last_decrease > (self.baseline or latency):
+                    self.window = max(self.minimum, self.window * self.decrease)
+                    self._last_decrease = now
+                    self.history.append((time.time(), self.window, "decrease"))
+            else:
+                if self.baseline is None:
+                    self.baseline = latency
+                if latency <= self.baseline * self.latency_tolerance:
+                    window = min(self.maximum, self.window + self.increase / self.window)
+                    if int(window) != int(self.window):
+                        self.history.append((time.time(), window, "increase"))
+                    self.window = window
+                self.baseline = 0.9 * self.baseline + 0.1 * latency
+            self._condition.notify_all()
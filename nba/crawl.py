@@ -0,0 +1,395 @@
+"""
+Crawl coordinator spreading endpoint calls over worker processes, on one or more machines.
+
+A crawl spec is expanded into tasks stored in a SQLite queue. Workers lease tasks, call the
+endpoint and hand the frame to a sink, then commit the task. Leases of workers that die expire
+and the task goes back to the queue::
+
+    queue = TaskQueue("season.db")
+    queue.plan("boxscores.traditional", game_id=game_ids, idx_data=[0, 1])
+    run("season.db", processes=8, sink=PickleSink("frames/"))
+
+Each worker process owns its client, share a nba.ratelimit.SQLiteTokenBucket between them to
+keep the whole crawl within one rate budget.
+"""
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+
+import pandas as pd
+
+from nba.apiclient import APIClient
+from nba.utils import ThreadConnection
+
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def expand(endpoint, **grid):
+    """
+    :param endpoint: client attribute path of the endpoint method, e.g. boxscores.traditional.
+    :param grid: values to call the endpoint with per argument, a list for every combination
+        or a single value used as is, e.g. game_id=game_ids, idx_data=[0, 1].
+    :returns: (endpoint, kwargs) pairs for every combination of the grid.
+    :rtype: generator
+    """
+    names = sorted(grid)
+    values = [
+        grid[name] if isinstance(grid[name], (list, tuple, range)) else [grid[name]]
+        for name in names
+    ]
+    for combination in itertools.product(*values):
+        yield endpoint, dict(zip(names, combination))
+
+
+def task_key(endpoint, kwargs):
+    """
+    :returns: key identifying a task, planning the same task twice keeps one.
+    :rtype: str
+    """
+    return "%s?%s" % (endpoint, json.dumps(kwargs, sort_keys=True, default=str))
+
+
+class Task(object):
+    def __init__(self, task_id, key, endpoint, kwargs, attempts):
+        self.task_id = task_id
+        self.key = key
+        self.endpoint = endpoint
+        self.kwargs = kwargs
+        self.attempts = attempts
+
+    def __repr__(self):
+        return "Task(%s)" % self.key
+
+
+class TaskQueue(object):
+    _connection = ThreadConnection(timeout=60)
+
+    def __init__(self, path, lease_seconds=300.0, max_attempts=3, journal_mode="WAL"):
+        """
+        Crawl tasks in a SQLite database, leased to workers of every process using the same file.
+
+        :param path: location of the database file.
+        :type path: str
+        :param lease_seconds: seconds a worker holds a task before it can be handed to another one.
+        :type lease_seconds: float
+        :param max_attempts: leases given for a task before it is left failed.
+        :type max_attempts: int
+        :param journal_mode: SQLite journal mode, use DELETE when the file is on a network
+            filesystem shared by several machines, where WAL is not supported.
+        :type journal_mode: str
+
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.journal_mode = journal_mode
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "id INTEGER PRIMARY KEY, key TEXT UNIQUE, endpoint TEXT, kwargs TEXT, "
+            "status TEXT, attempts INTEGER, owner TEXT, expires REAL, error TEXT, updated REAL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, expires)"
+        )
+
+    def _transaction(self, func, *args):
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(connection, *args)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return result
+
+    def add(self, tasks):
+        """
+        :param tasks: (endpoint, kwargs) pairs, see nba.crawl.expand.
+        :returns: number of new tasks, tasks already queued are left as they are.
+        :rtype: int
+        """
+        now = time.time()
+        rows = [
+            (task_key(endpoint, kwargs), endpoint, json.dumps(kwargs, default=str), PENDING, 0, now)
+            for endpoint, kwargs in tasks
+        ]
+
+        def insert(connection):
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO tasks (key, endpoint, kwargs, status, attempts, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return connection.total_changes - before
+
+        return self._transaction(insert)
+
+    def plan(self, endpoint, **grid):
+        """
+        Queue a task for every combination of the grid, see nba.crawl.expand.
+
+        :returns: number of new tasks.
+        :rtype: int
+        """
+        return self.add(expand(endpoint, **grid))
+
+    def lease(self, owner, count=1):
+        """
+        :param owner: name of the worker taking the tasks.
+        :param count: maximum tasks to take.
+        :returns: tasks now held by the worker, pending ones first, then ones whose lease expired.
+        :rtype: list
+        """
+
+        def take(connection):
+            now = time.time()
+            connection.execute(
+                "UPDATE tasks SET status = ?, owner = NULL, error = ?, updated = ? "
+                "WHERE status = ? AND expires < ? AND attempts >= ?",
+                (FAILED, "lease expired", now, LEASED, now, self.max_attempts),
+            )
+            rows = connection.execute(
+                "SELECT id, key, endpoint, kwargs, attempts FROM tasks "
+                "WHERE (status = ? OR (status = ? AND expires < ?)) AND attempts < ? "
+                "ORDER BY status = ?, id LIMIT ?",
+                (PENDING, LEASED, now, self.max_attempts, LEASED, count),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE tasks SET status = ?, owner = ?, expires = ?, attempts = attempts + 1, "
+                "updated = ? WHERE id = ?",
+                [(LEASED, owner, now + self.lease_seconds, now, row[0]) for row in rows],
+            )
+            return rows
+
+        return [
+            Task(task_id, key, endpoint, json.loads(kwargs), attempts + 1)
+            for task_id, key, endpoint, kwargs, attempts in self._transaction(take)
+        ]
+
+    def _finish(self, task, owner, status, error=None):
+        def update(connection):
+            cursor = connection.execute(
+                "UPDATE tasks SET status = ?, owner = NULL, expires = NULL, error = ?, updated = ? "
+                "WHERE id = ? AND owner = ? AND status = ?",
+                (status, error, time.time(), task.task_id, owner, LEASED),
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(update)
+
+    def complete(self, task, owner):
+        """
+        :param task: task leased by the worker.
+        :param owner: name of the worker.
+        :returns: whether the worker still held the lease, False when it expired and was handed on.
+        :rtype: bool
+        """
+        return self._finish(task, owner, DONE)
+
+    def fail(self, task, owner, error):
+        """
+        Give a task back, it is leased again unless it used up its attempts.
+
+        :param task: task leased by the worker.
+        :param owner: name of the worker.
+        :param error: description of the failure.
+        :returns: whether the worker still held the lease.
+        :rtype: bool
+        """
+        status = FAILED if task.attempts >= self.max_attempts else PENDING
+        return self._finish(task, owner, status, error)
+
+    def extend(self, task, owner):
+        """
+        Renew the lease of a task taking longer than lease_seconds.
+
+        :returns: whether the worker still held the lease.
+        :rtype: bool
+        """
+
+        def update(connection):
+            cursor = connection.execute(
+                "UPDATE tasks SET expires = ? WHERE id = ? AND owner = ? AND status = ?",
+                (time.time() + self.lease_seconds, task.task_id, owner, LEASED),
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(update)
+
+    def retry_failed(self):
+        """
+        Put failed tasks back in the queue with fresh attempts.
+
+        :returns: number of tasks requeued.
+        :rtype: int
+        """
+
+        def update(connection):
+            return connection.execute(
+                "UPDATE tasks SET status = ?, attempts = 0, updated = ? WHERE status = ?",
+                (PENDING, time.time(), FAILED),
+            ).rowcount
+
+        return self._transaction(update)
+
+    def counts(self):
+        """
+        :returns: number of tasks per status.
+        :rtype: dict
+        """
+        counts = dict((status, 0) for status in (PENDING, LEASED, DONE, FAILED))
+        counts.update(
+            self._connection.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status")
+        )
+        return counts
+
+    def failures(self):
+        """
+        :returns: (key, error) of every task left failed.
+        :rtype: list
+        """
+        return self._connection.execute(
+            "SELECT key, error FROM tasks WHERE status = ?", (FAILED,)
+        ).fetchall()
+
+    def unfinished(self):
+        """
+        :returns: whether tasks are still pending or leased.
+        :rtype: bool
+        """
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM tasks WHERE status IN (?, ?) LIMIT 1", (PENDING, LEASED)
+            ).fetchone()
+            is not None
+        )
+
+
+class PickleSink(object):
+    def __init__(self, directory):
+        """
+        Store every result as a pickle file named after its task, a frame or, for tasks with
+        idx_data None, the dict of frames keyed by result set name.
+
+        :param directory: directory the files are written to, created if missing.
+        :type directory: str
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, task):
+        name = "".join(c if c.isalnum() or c in "-_." else "_" for c in task.key)
+        return os.path.join(self.directory, name + ".pkl")
+
+    def __call__(self, task, result):
+        path = self.path(task)
+        # written aside and renamed so a worker dying mid write leaves no partial file.
+        partial = "%s.%d.part" % (path, os.getpid())
+        pd.to_pickle(result, partial)
+        os.replace(partial, path)
+
+
+def resolve(client, endpoint):
+    """
+    :param client: API client.
+    :param endpoint: attribute path of the endpoint method, e.g. boxscores.traditional.
+    :returns: the bound endpoint method.
+    """
+    target = client
+    for name in endpoint.split("."):
+        target = getattr(target, name)
+    return target
+
+
+def worker_name():
+    return "%s:%d:%d" % (socket.gethostname(), os.getpid(), threading.get_ident())
+
+
+def work(queue, sink, client=None, batch=4, idle=None, poll_interval=1.0):
+    """
+    Lease, fetch and commit tasks until the queue is drained.
+
+    :param queue: task queue, or path of its database.
+    :param sink: called with (task, result) for every fetched task before it is committed,
+        e.g. nba.crawl.PickleSink.
+    :param client: API client making the calls, defaults to a new nba.APIClient.
+    :param batch: tasks leased at once.
+    :type batch: int
+    :param idle: seconds to keep polling once nothing is left to lease, waiting for the leases
+        of other workers to finish or expire. None stops as soon as nothing is pending or leased.
+    :type idle: float
+    :param poll_interval: seconds between polls while tasks are leased by other workers.
+    :type poll_interval: float
+    :returns: number of tasks completed by this worker.
+    :rtype: int
+    """
+    if isinstance(queue, str):
+        queue = TaskQueue(queue)
+    client = client or APIClient()
+    owner = worker_name()
+    completed = 0
+    idle_since = None
+    while True:
+        tasks = queue.lease(owner, batch)
+        if not tasks:
+            if not queue.unfinished():
+                return completed
+            idle_since = idle_since or time.monotonic()
+            if idle is not None and time.monotonic() - idle_since > idle:
+                return completed
+            time.sleep(poll_interval)
+            continue
+        idle_since = None
+        for task in tasks:
+            # later tasks of the batch waited on earlier ones, renew the lease before fetching
+            # and skip the task when it already expired and went to another worker.
+            if not queue.extend(task, owner):
+                continue
+            try:
+                result = resolve(client, task.endpoint)(**task.kwargs)
+                sink(task, result)
+            except Exception:
+                queue.fail(task, owner, traceback.format_exc(limit=3))
+            else:
+                completed += queue.complete(task, owner)
+
+
+def _work_process(path, sink, client_factory, batch, queue_options):
+    client = client_factory() if client_factory is not None else None
+    return work(TaskQueue(path, **queue_options), sink, client=client, batch=batch)
+
+
+def run(path, sink, processes=None, client_factory=None, batch=4, **queue_options):
+    """
+    Work through the queue with several processes of this machine, other machines can run
+    nba.crawl.work or nba.crawl.run against the same file at the same time.
+
+    :param path: location of the task queue database.
+    :param sink: picklable callable receiving (task, result), e.g. nba.crawl.PickleSink.
+    :param processes: worker processes, defaults to the number of cores.
+    :param client_factory: picklable callable returning the client of each worker,
+        defaults to nba.APIClient.
+    :param batch: tasks leased at once by each worker.
+    :param queue_options: lease_seconds, max_attempts or journal_mode for nba.crawl.TaskQueue.
+    :returns: number of tasks per status once every worker stopped.
+    :rtype: dict
+    """
+    queue = TaskQueue(path, **queue_options)
+    processes = processes or os.cpu_count() or 1
+    with multiprocessing.Pool(processes) as pool:
+        pool.starmap(
+            _work_process,
+            [(path, sink, client_factory, batch, queue_options)] * processes,
+        )
+    return queue.counts()
@@ -0,0 +1,55 @@
+import contextlib
+import contextvars
+import time
+
+from nba.exceptions import DeadlineExceeded
+
+
+_deadline = contextvars.ContextVar("nba_deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """
+    Bound every request made inside the block, including retries and waits, to finish within seconds.
+
+    Nested deadlines never extend an outer one. Threads and tasks started with a copy of the
+    current context, as fetch_many and AsyncAPIClient do, share the same deadline.
+
+    :param seconds: time budget for the whole block, None leaves the current deadline unchanged.
+    :type seconds: float
+    """
+    if seconds is None:
+        yield
+        return
+    end = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        end = min(end, current)
+    token = _deadline.set(end)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining():
+    """
+    :returns: seconds left before the current deadline, None when no deadline is set.
+    :rtype: float
+    """
+    end = _deadline.get()
+    if end is None:
+        return None
+    return end - time.monotonic()
+
+
+def check():
+    """
+    :returns: seconds left before the current deadline, None when no deadline is set.
+    :raises: DeadlineExceeded if the deadline has passed.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("deadline exceeded by %.3fs" % -left)
+    return left
@@ -0,0 +1,64 @@
+import json
+
+
+def _stdlib():
+    return json.loads
+
+
+def _orjson():
+    import orjson
+
+    return orjson.loads
+
+
+def _simdjson():
+    import simdjson
+
+    return simdjson.loads
+
+
+def _ujson():
+    import ujson
+
+    return ujson.loads
+
+
+BACKENDS = {
+    "orjson": _orjson,
+    "simdjson": _simdjson,
+    "ujson": _ujson,
+    "json": _stdlib,
+}
+PREFERENCE = ("orjson", "simdjson", "ujson", "json")
+
+
+def available():
+    """
+    :returns: names of the json backends importable in this environment, fastest first.
+    :rtype: list
+    """
+    names = []
+    for name in PREFERENCE:
+        try:
+            BACKENDS[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_decoder(name="auto"):
+    """
+    :param name: backend name, one of orjson, simdjson, ujson, json, or auto for the fastest installed.
+    :type name: str
+    :returns: function decoding json text or bytes.
+    :raises: ImportError if the requested backend is not installed.
+    """
+    if name == "auto":
+        name = available()[0]
+    if name not in BACKENDS:
+        raise ValueError("unknown json backend %r, expected one of %s" % (name, PREFERENCE))
+    return BACKENDS[name]()
+
+
+loads = get_decoder()
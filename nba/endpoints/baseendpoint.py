@@ -1,18 +1,38 @@
+import contextvars
+import inspect
 import json
-import pandas as pd
-from functools import lru_cache
+import time
+from urllib.parse import urlparse
 
+import requests
+
+from nba import deadlines, frames, hooks, streaming
+from nba.cache import cache_key
+from nba.exceptions import DeadlineExceeded
 from nba.utils import check_status_code, HDict
 
+THROTTLED_STATUS_CODES = (400, 429, 503)
+
+# headers only stats.nba.com expects, kept from requests to other hosts.
+STATS_HEADERS = frozenset(["Content-Type", "x-nba-stats-origin", "x-nba-stats-token"])
+
+# method of the last request made in the current context, for the frames built from it.
+_requested_method = contextvars.ContextVar("nba_requested_method", default=None)
+
 
 class BaseEndpoint(object):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, func in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(func):
+                setattr(cls, name, hooks.instrument("%s.%s" % (cls.__name__, name), func))
+
     def __init__(self, parent):
         """
         :param parent: API client.
         """
         self.client = parent
 
-    @lru_cache(maxsize=16)
     def request(
         self,
         method,
@@ -29,42 +49,274 @@ class BaseEndpoint(object):
         :param session: Requests session to be used, reduces latency.
         :param request_url: specific url to use rather than building it.
         """
-        session = session or self.client.session
+        self.client.hooks.requesting(method, params)
+        _requested_method.set(method)
         if request_url is None:
             request_url = "%s%s" % (self.client.url, method)
-        headers = {
-            **self.client.headers,
-            **{"Referer": f"http://stats.nba.com/{referer}/"},
-        }
-        response = session.get(
-            request_url, params=params, data=json.dumps(data), headers=headers
+        key = cache_key(request_url, params)
+        # method is None for calls to hosts other than stats.nba.com, no ttl covers their
+        # responses so they are never cached.
+        cache = self.client.cache if method is not None else None
+        response_json = None
+        if cache is not None:
+            response_json = cache.get(key)
+            self.client.hooks.emit(
+                hooks.CACHE, method=method, params=params, hit=response_json is not None
+            )
+        if response_json is None:
+            singleflight = self.client.singleflight
+            if singleflight is None:
+                response_json = self._fetch(
+                    key, method, params, data, session, request_url, referer
+                )
+            else:
+                response_json = singleflight.do(
+                    key,
+                    self._fetch,
+                    key,
+                    method,
+                    params,
+                    data,
+                    session,
+                    request_url,
+                    referer,
+                )
+        self.client.hooks.requested()
+        return response_json
+
+    def _fetch(self, key, method, params, data, session, request_url, referer):
+        session = session or self.client.sessions.session_for(request_url)
+        if method is None:
+            # other hosts get neither the stats.nba.com headers nor the json body.
+            headers = {
+                name: value
+                for name, value in self.client.headers.items()
+                if name not in STATS_HEADERS
+            }
+            data = None
+        else:
+            headers = dict(
+                self.client.headers, Referer=f"http://stats.nba.com/{referer}/"
+            )
+        headers["Host"] = urlparse(request_url).netloc
+        timeout = self.client.timeout_for(method or request_url)
+        cassette = self.client.cassette
+        stream = cassette is None and self.client.streams(method)
+        if cassette is not None and cassette.replaying:
+            response = cassette.play(key)
+        else:
+            response = self._get_with_retries(
+                method, session, request_url, params, data, headers, timeout, stream
+            )
+            if cassette is not None:
+                cassette.record(key, response)
+        check_status_code(response, loads=self.client.json_loads)
+        start = time.perf_counter()
+        if stream:
+            with response:
+                response.raw.decode_content = True
+                reader = streaming.CountingReader(response.raw)
+                response_json = streaming.parse_result_sets(reader)
+            size = reader.nbytes
+        else:
+            response_json = self.client.json_loads(response.content)
+            size = len(response.content)
+        self.client.hooks.emit(
+            hooks.DECODE,
+            method=method,
+            params=params,
+            duration=time.perf_counter() - start,
+            nbytes=size,
+        )
+        if response.raw is not None:
+            self.client.transfer.record(
+                response.headers.get("Content-Encoding", "identity"),
+                response.raw.tell(),
+                size,
+            )
+        cache = self.client.cache if method is not None else None
+        if cache is not None:
+            cache.set(key, response_json, method=method, params=params, size=size)
+        return response_json
+
+    def _get_with_retries(
+        self, method, session, request_url, params, data, headers, timeout, stream=False
+    ):
+        retry = self.client.retry
+        retry.budget.record_request()
+        attempt = 0
+        while True:
+            try:
+                response = self._send(
+                    method, session, request_url, params, data, headers, timeout, stream
+                )
+            except (requests.Timeout, requests.ConnectionError):
+                if not retry.should_retry(attempt):
+                    raise
+                response = None
+            else:
+                if not retry.should_retry(attempt, response):
+                    return response
+                response.close()
+            delay = retry.delay(attempt, response)
+            self.client.hooks.emit(
+                hooks.RETRY,
+                method=method,
+                params=params,
+                duration=delay,
+                status=response.status_code if response is not None else None,
+            )
+            remaining = deadlines.remaining()
+            if remaining is not None and delay >= remaining:
+                raise DeadlineExceeded("no time left to retry %s" % request_url)
+            time.sleep(delay)
+            attempt += 1
+
+    def _send(
+        self, method, session, request_url, params, data, headers, timeout, stream=False
+    ):
+        hedge = self.client.hedge
+        if hedge is None or not hedge.applies(method):
+            return self._get(
+                method, session, request_url, params, data, headers, timeout, stream
+            )
+
+        def attempt(sending=None, rate_limited=True):
+            # attempts run on hedging threads, each uses the session of its own thread.
+            return self._get(
+                method,
+                self.client.sessions.session_for(request_url),
+                request_url,
+                params,
+                data,
+                headers,
+                timeout,
+                stream,
+                rate_limited=rate_limited,
+                sending=sending,
+            )
+
+        return hedge.run(
+            method, attempt, lambda: attempt(rate_limited=False), self.client.rate_limiter
         )
-        if response.status_code == 400:
+
+    def _get(
+        self,
+        method,
+        session,
+        request_url,
+        params,
+        data,
+        headers,
+        timeout,
+        stream=False,
+        rate_limited=True,
+        sending=None,
+    ):
+        remaining = deadlines.check()
+        breakers = self.client.breakers
+        breaker = breakers.breaker_for(request_url) if breakers is not None else None
+        if breaker is not None:
+            breaker.before_call()
+        rate_limiter = self.client.rate_limiter if rate_limited else None
+        try:
+            if rate_limiter is not None:
+                if not rate_limiter.acquire(timeout=remaining):
+                    raise DeadlineExceeded("rate limited past deadline for %s" % request_url)
+                remaining = deadlines.check()
+        except DeadlineExceeded:
+            if breaker is not None:
+                breaker.cancel()
+            raise
+        if remaining is not None:
+            timeout = tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        concurrency = self.client.concurrency
+        if sending is not None:
+            sending()
+        start = time.monotonic()
+        try:
             response = session.get(
-                request_url, params=params, data=json.dumps(data), headers=headers
+                request_url,
+                params=params,
+                data=json.dumps(data) if data is not None else None,
+                headers=headers,
+                timeout=timeout,
+                stream=stream,
+            )
+        except (requests.Timeout, requests.ConnectionError):
+            elapsed = time.monotonic() - start
+            if concurrency is not None:
+                concurrency.record(elapsed, throttled=True)
+            if breaker is not None:
+                breaker.record(success=False)
+            self.client.hooks.emit(
+                hooks.HTTP, method=method, params=params, duration=elapsed, status=None
             )
-        check_status_code(response)
-        return response.json()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.cancel()
+            raise
+        elapsed = time.monotonic() - start
+        hedge = self.client.hedge
+        if hedge is not None and hedge.applies(method):
+            hedge.observe(method, elapsed)
+        if breaker is not None:
+            breaker.record(success=not breaker.is_failure(response.status_code))
+        if concurrency is not None:
+            concurrency.record(
+                elapsed, throttled=response.status_code in THROTTLED_STATUS_CODES
+            )
+        self.client.hooks.emit(
+            hooks.HTTP,
+            method=method,
+            params=params,
+            duration=elapsed,
+            status=response.status_code,
+            nbytes=response.raw.tell() if not stream and response.raw is not None else None,
+        )
+        return response
 
-    @staticmethod
-    def process_response(response_json, idx_val, result_name):
+    def process_response(self, response_json, idx_val, result_name):
         """
         Parse data received from stats.nba.com endpoints
 
         :param response_json: data returned from requests to stats.nba.com endpoint.
         :type response_json: JSON
-        :param idx_val: the index to retrieve from the returned data.
+        :param idx_val: the index to retrieve from the returned data, None for every result set.
         :type idx_val: int
         :param result_name: json key to target for parsing results.
         :type result_name: str
-        :returns: parsed nba data.
+        :returns: parsed nba data, with compact dtypes when the client has a schema registry.
+            With idx_val None, a dict of every result set frame keyed by result set name.
         :rtype: Dataframe
 
         """
+        if idx_val is None:
+            result_sets = response_json[result_name]
+            if isinstance(result_sets, dict):
+                result_sets = [result_sets]
+            frames_by_name = {}
+            for idx, result_set in enumerate(result_sets):
+                name = result_set.get("name") or idx
+                frames_by_name[name if name not in frames_by_name else idx] = self._frame(
+                    result_set
+                )
+            return frames_by_name
         try:
-            headers = response_json[result_name][idx_val]["headers"]
-            values = response_json[result_name][idx_val]["rowSet"]
+            result_set = response_json[result_name][idx_val]
         except KeyError:
-            headers = response_json[result_name]["headers"]
-            values = response_json[result_name]["rowSet"]
-        return pd.DataFrame(values, columns=[h.lower() for h in headers])
+            result_set = response_json[result_name]
+        return self._frame(result_set)
+
+    def _frame(self, result_set):
+        headers = [h.lower() for h in result_set["headers"]]
+        if "columns" in result_set:
+            # streamed payloads arrive already split into columns.
+            df = frames.build_frame(headers, columns=result_set["columns"])
+        else:
+            df = frames.build_frame(headers, rows=result_set["rowSet"])
+        schemas = self.client.schemas
+        if schemas is not None:
+            df = schemas.apply(df, _requested_method.get(), result_set.get("name"))
+        return df
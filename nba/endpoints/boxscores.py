@@ -19,7 +19,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -63,7 +63,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -107,7 +107,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -151,7 +151,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -195,7 +195,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -240,7 +240,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -285,7 +285,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
@@ -336,7 +336,7 @@ class Boxscores(BaseEndpoint):
     
         :param game_id: id for the game to get data for.
         :type game_id: str
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param start_period: filter starting quarter to retrieve data for.
         :type start_period: nba.nba.bin.enums.StartPeriod
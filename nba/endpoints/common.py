@@ -87,7 +87,7 @@ class Common(BaseEndpoint):
     
         :param team_id: id of the team whose roster to retrieve
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param season: season for which we require data.
         :type season: str('%Y-%y')
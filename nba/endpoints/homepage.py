@@ -18,7 +18,7 @@ class Homepage(BaseEndpoint):
         """
         Get top 5 players/teams by a particular stat.
     
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: league to filter for.
         :type league_id: nba.enums.LeagueID
@@ -66,7 +66,7 @@ class Homepage(BaseEndpoint):
         """
        Get top 5 players/teams by a particular stat type.
     
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: league to filter for.
         :type league_id: nba.enums.LeagueID
@@ -119,7 +119,7 @@ class Homepage(BaseEndpoint):
         """
         Get top 5 players/teams by a particular stat.
     
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: league to filter for.
         :type league_id: nba.enums.LeagueID
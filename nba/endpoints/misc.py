@@ -1,5 +1,4 @@
 import datetime
-import requests
 import pandas as pd
 
 from nba import enums
@@ -14,7 +13,7 @@ class Misc(BaseEndpoint):
         """
         Get information on how current playoff matchups and conference standings are.
     
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: league to filter for.
         :type league_id: nba.enums.LeagueID
@@ -69,7 +68,7 @@ class Misc(BaseEndpoint):
         
         :return: News updates.
         """
-        url = "http://stats-prod.nba.com/wp-json/statscms/v1/rotowire/player"
-        r = requests.get(url).json()
+        url = "%srotowire/player" % self.client.cms_url
+        r = self.request(None, request_url=url)
         df = pd.DataFrame(r.get("ListItems", []))
         return df
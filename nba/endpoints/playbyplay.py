@@ -1,8 +1,7 @@
-import requests
 import pandas as pd
 
 from nba import enums
-from nba.utils import clean_locals, check_status_code
+from nba.utils import clean_locals, HDict
 from nba.endpoints.baseendpoint import BaseEndpoint
 
 
@@ -41,14 +40,12 @@ class PlayByPlay(BaseEndpoint):
         :param period: 
         :return: 
         """
-        response = requests.get(
-            "http://uk.global.nba.com/stats2/game/playbyplay.json",
-            {"gameId": game_id, "locale": locale, "period": period},
-        )
-        check_status_code(response)
+        url = "%sgame/playbyplay.json" % self.client.global_url
+        params = HDict({"gameId": game_id, "locale": locale, "period": period})
+        r = self.request(None, params, request_url=url)
         data = [
             events
-            for period in response.json().get("payload", {}).get("playByPlays", {})
+            for period in r.get("payload", {}).get("playByPlays", {})
             for events in period.get("events", [])
         ]
         return pd.DataFrame(data[::-1])
@@ -1004,7 +1004,7 @@ class Player(BaseEndpoint):
     
         :param player_id: ID of the player for whom to get stats breakdown.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param per_mode: grouping of stat data. Totals or PerGame accepted. Required.
         :type per_mode: nba.enums.PerMode
@@ -1113,7 +1113,7 @@ class Player(BaseEndpoint):
         :type player_id_list: int
         :param vs_player_id_list: Player ID for Player 2 in comparison.
         :type vs_player_id_list: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1212,7 +1212,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1316,7 +1316,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1419,7 +1419,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param game_id: ID of a specific game. Default '' returns all. Required.
         :type game_id: int
@@ -1521,7 +1521,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1621,7 +1621,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1720,7 +1720,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1817,7 +1817,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1918,7 +1918,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2015,7 +2015,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID for Player 1 in comparison.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2103,7 +2103,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID to retrieve data for.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2179,7 +2179,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID to retrieve data for.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2345,7 +2345,7 @@ class Player(BaseEndpoint):
     
         :param player_id: player ID to retrieve data for.
         :type player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2453,7 +2453,7 @@ class Player(BaseEndpoint):
         :type player_id_1: int
         :param vs_player_id_1: player ID for VsTeam Player 1 in comparison. Required.
         :type vs_player_id_1: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param player_id_2: player ID for Player 2 in comparison. Default 0 will not include a second player.
         :type player_id_2: int
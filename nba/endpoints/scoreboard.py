@@ -12,7 +12,7 @@ class Scoreboard(BaseEndpoint):
     
         :param game_date: reference date to get data for.
         :type game_date: str('%Y-%m-%d')
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param day_off_set: Number days prior to GameDate to get data for.
         :type day_off_set: int
@@ -923,7 +923,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -996,7 +996,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1076,7 +1076,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1170,7 +1170,7 @@ class Team(BaseEndpoint):
         :type team_id: int
         :param vs_player_id: player ID for comparison. Required.
         :type vs_player_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1274,7 +1274,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to get stats for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1378,7 +1378,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1476,7 +1476,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1576,7 +1576,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team for which to retrieve data.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1675,7 +1675,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team for which to retrieve data.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1772,7 +1772,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1872,7 +1872,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -1969,7 +1969,7 @@ class Team(BaseEndpoint):
     
         :param team_id: Team to retrieve data for.
         :type team_id: int
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2121,7 +2121,7 @@ class Team(BaseEndpoint):
     
         :param team_id: ID of specific team to filter. Default 0, returns all.
         :type team_id: nba.enums.TeamID
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: ID of the league to get data for. Default 00. Required.
         :type league_id: nba.enums.LeagueID
@@ -2185,7 +2185,7 @@ class Team(BaseEndpoint):
         """
         Breakdown of each franchise's record in the NBA.
 
-        :param idx_data: the index to retrieve data from json.
+        :param idx_data: the index to retrieve data from json, None for every table keyed by name.
         :type idx_data: int
         :param league_id: define league to look at, nba.
         :type league_id: nba.enums.LeagueID
@@ -2231,7 +2231,7 @@ class Team(BaseEndpoint):
         :rtype: DataFrame
         """
         params = clean_locals(locals())
-        url = r"http://stats-prod.nba.com/wp-json/statscms/v1/synergy/team/"
+        url = "%ssynergy/team/" % self.client.cms_url
         r = self.request(None, params, request_url=url)
         df = pd.DataFrame(r.get("results", []))
         return df
@@ -1,9 +1,4 @@
-import json
-
-if not hasattr(json, "JSONDecodeError"):
-    json.JSONDecodeError = ValueError
-else:
-    from json.decoder import JSONDecodeError
+from nba import decoders
 
 
 class NBAError(Exception):
@@ -11,14 +6,31 @@ class NBAError(Exception):
 
 
 class ApiError(NBAError):
-    def __init__(self, response):
+    def __init__(self, response, loads=None):
         self.response = response
         self.status_code = response.status_code
         try:
-            error_data = response.json().get("errors")
+            error_data = (loads or decoders.loads)(response.content).get("errors")
             self.message = error_data[0].get("messages", "UNKNOWN")
 
-        except (KeyError, JSONDecodeError, TypeError):
+        except (AttributeError, KeyError, TypeError, ValueError):
             self.message = "UNKNOWN"
             print(response)
         super(ApiError, self).__init__(self.message)
+
+
+class DeadlineExceeded(NBAError):
+    pass
+
+
+class CassetteMiss(NBAError):
+    pass
+
+
+class CircuitOpen(NBAError):
+    def __init__(self, host, retry_in):
+        self.host = host
+        self.retry_in = retry_in
+        super(CircuitOpen, self).__init__(
+            "circuit open for %s, retrying in %.1fs" % (host, retry_in)
+        )
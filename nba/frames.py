@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+
+_NUMERIC = frozenset(["integer", "floating", "mixed-integer-float", "decimal"])
+
+
+def object_array(values):
+    """
+    :param values: sequence of json values.
+    :returns: one dimensional object array, nested lists kept as single cells.
+    :rtype: numpy.ndarray
+    """
+    array = np.empty(len(values), dtype=object)
+    for idx, value in enumerate(values):
+        array[idx] = value
+    return array
+
+
+def column_array(values):
+    """
+    Give one column of json values the dtype pandas would infer for it from rows.
+
+    :param values: object array holding the values of the column.
+    :returns: int64 when every value is an int, float64 for numbers with nulls as NaN,
+        bool for booleans, the object array otherwise.
+    :rtype: numpy.ndarray
+    """
+    kind = infer_dtype(values, skipna=False)
+    if kind == "integer":
+        try:
+            return values.astype(np.int64)
+        except OverflowError:
+            # ints beyond int64 stay python objects.
+            return values
+    if kind in _NUMERIC:
+        return values.astype(np.float64)
+    if kind == "boolean":
+        return values.astype(bool)
+    if kind in ("mixed", "mixed-integer") and infer_dtype(values, skipna=True) in _NUMERIC:
+        # numbers with nulls.
+        values = values.copy()
+        values[pd.isnull(values)] = np.nan
+        return values.astype(np.float64)
+    return values
+
+
+def build_frame(headers, rows=None, columns=None):
+    """
+    Build a frame by transposing the rowSet once into a 2d object array and typing each column
+    in a single vectorised pass, rather than letting pandas infer types from row lists.
+
+    :param headers: column names.
+    :param rows: rowSet, list of rows.
+    :param columns: values per column, as produced by nba.streaming, instead of rows.
+    :rtype: Dataframe
+    """
+    if columns is None:
+        if not rows:
+            return pd.DataFrame(rows, columns=headers)
+        try:
+            table = np.array(rows, dtype=object)
+        except ValueError:
+            table = None
+        if table is None or table.ndim != 2 or table.shape[1] != len(headers):
+            # ragged rows or nested cells, left to pandas.
+            return pd.DataFrame(rows, columns=headers)
+        columns = [table[:, idx] for idx in range(len(headers))]
+    else:
+        size = len(columns[0]) if columns else 0
+        # streamed sets have no list for trailing columns no row reached.
+        columns = list(columns) + [[None] * size for _ in headers[len(columns):]]
+        columns = [object_array(values) for values in columns]
+    df = pd.DataFrame(dict(enumerate(column_array(values) for values in columns)), copy=False)
+    df.columns = headers
+    return df
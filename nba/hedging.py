@@ -0,0 +1,156 @@
+import concurrent.futures
+import contextvars
+import fnmatch
+import threading
+from collections import deque
+
+
+class HedgePolicy(object):
+    def __init__(
+        self,
+        percentile=0.95,
+        methods=None,
+        min_delay=0.05,
+        min_samples=20,
+        history_size=256,
+        max_workers=64,
+    ):
+        """
+        Send a duplicate of a request that is slower than most recent ones, and use whichever answers first.
+
+        :param percentile: share of recent latencies of the method a request may take before it is hedged.
+        :type percentile: float
+        :param methods: stats.nba.com methods to hedge, shell style patterns allowed,
+            e.g. ("playervsplayer", "*dashboard*"). None hedges every method.
+        :type methods: tuple
+        :param min_delay: shortest wait in seconds before hedging, whatever the recent latencies.
+        :type min_delay: float
+        :param min_samples: latencies of a method recorded before its requests are hedged.
+        :type min_samples: int
+        :param history_size: latencies kept per method.
+        :type history_size: int
+        :param max_workers: threads running hedged requests, two per request in flight at most.
+        :type max_workers: int
+
+        """
+        self.percentile = percentile
+        self.methods = methods
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.history_size = history_size
+        self.max_workers = max_workers
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies = {}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def applies(self, method):
+        """
+        :param method: stats.nba.com method, None for other hosts.
+        :returns: whether requests of the method are hedged.
+        :rtype: bool
+        """
+        if method is None:
+            return False
+        if self.methods is None:
+            return True
+        return any(fnmatch.fnmatchcase(method, pattern) for pattern in self.methods)
+
+    def observe(self, method, latency):
+        """
+        :param method: stats.nba.com method.
+        :param latency: seconds the HTTP round trip of a request of the method took, excluding
+            rate limiter and circuit breaker waits.
+        """
+        with self._lock:
+            latencies = self._latencies.get(method)
+            if latencies is None:
+                latencies = self._latencies[method] = deque(maxlen=self.history_size)
+            latencies.append(latency)
+
+    def delay(self, method):
+        """
+        :param method: stats.nba.com method.
+        :returns: seconds to wait for a response before hedging, None while too few latencies are known.
+        :rtype: float
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(method, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        idx = min(len(latencies) - 1, int(self.percentile * len(latencies)))
+        return max(self.min_delay, latencies[idx])
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="nba-hedge"
+                    )
+        return self._executor
+
+    def _submit(self, func, *args):
+        return self.executor.submit(contextvars.copy_context().run, func, *args)
+
+    def run(self, method, primary, duplicate, rate_limiter=None):
+        """
+        Call primary, and duplicate as well if primary is still running after the hedge delay.
+        The delay runs from the moment primary sends its request, time spent waiting for a
+        rate limiter token or on a circuit breaker before that does not count.
+
+        :param method: stats.nba.com method requested.
+        :param primary: sends the request, returns the response. Called with a callback to run
+            right before the request goes out.
+        :param duplicate: sends the same request without going through the rate limiter.
+        :param rate_limiter: limiter a token is taken from without waiting before hedging,
+            the request is not hedged when none is free.
+        :returns: the first response received, the other one is closed.
+        :rtype: requests.Response
+        """
+        delay = self.delay(method)
+        if delay is None:
+            return primary(None)
+        sent = threading.Event()
+        first = self._submit(primary, sent.set)
+        first.add_done_callback(lambda _: sent.set())
+        sent.wait()
+        try:
+            return first.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        if rate_limiter is not None and not rate_limiter.try_acquire():
+            return first.result()
+        with self._lock:
+            self.hedged += 1
+        second = self._submit(duplicate)
+        futures = [first, second]
+        pending = set(futures)
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in futures:
+                if future in done and future.exception() is None:
+                    loser = second if future is first else first
+                    if not loser.cancel():
+                        loser.add_done_callback(_discard)
+                    if future is second:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        # both attempts raised, surface the error of the original request.
+        return first.result()
+
+    def close(self):
+        """Stop the hedging threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _discard(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
@@ -0,0 +1,182 @@
+import contextlib
+import contextvars
+import functools
+import time
+
+
+PARAMS = "params"
+HTTP = "http"
+DECODE = "decode"
+FRAME = "frame"
+CACHE = "cache"
+RETRY = "retry"
+STAGES = (PARAMS, HTTP, DECODE, FRAME, CACHE, RETRY)
+
+_current_call = contextvars.ContextVar("nba_current_call", default=None)
+
+
+class Event(object):
+    def __init__(
+        self,
+        stage,
+        endpoint=None,
+        method=None,
+        params=None,
+        duration=None,
+        status=None,
+        nbytes=None,
+        rows=None,
+        hit=None,
+    ):
+        """
+        Timing of one stage of an endpoint call.
+
+        :param stage: one of params, http, decode, frame, or cache and retry for lookups and retries.
+        :param endpoint: endpoint method called, e.g. Team.team_lineups, None for direct request calls.
+        :param method: stats.nba.com method requested, None for other hosts.
+        :param params: params sent with the request.
+        :param duration: seconds spent in the stage, the backoff delay for retry.
+        :param status: HTTP status code for http and retry, None when the attempt raised.
+        :param nbytes: bytes read from the wire for http, decoded bytes for decode.
+        :param rows: rows in the returned frame, frame stage only.
+        :param hit: whether the response was served from cache, cache stage only.
+        """
+        self.stage = stage
+        self.endpoint = endpoint
+        self.method = method
+        self.params = params
+        self.duration = duration
+        self.status = status
+        self.nbytes = nbytes
+        self.rows = rows
+        self.hit = hit
+
+    def __repr__(self):
+        return "Event(%s)" % ", ".join(
+            "%s=%r" % (name, value) for name, value in vars(self).items() if value is not None
+        )
+
+
+class _Call(object):
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.method = None
+        self.params = None
+        self.started = time.perf_counter()
+        self.requested = None
+
+
+class Hooks(object):
+    def __init__(self):
+        """
+        Callbacks notified with an nba.hooks.Event after each stage of every endpoint call.
+        """
+        self._callbacks = []
+
+    @property
+    def active(self):
+        """Whether any callback is registered, stages are only timed when one is."""
+        return bool(self._callbacks)
+
+    def register(self, callback, stages=STAGES):
+        """
+        :param callback: called with an nba.hooks.Event.
+        :param stages: stages the callback is interested in.
+        :returns: the callback, so register can be used as a decorator.
+        """
+        self._callbacks.append((callback, frozenset(stages)))
+        return callback
+
+    def unregister(self, callback):
+        """
+        :param callback: callback previously registered.
+        """
+        self._callbacks = [item for item in self._callbacks if item[0] is not callback]
+
+    def emit(self, stage, **fields):
+        """
+        Notify every callback registered for stage, the endpoint name is filled in from the current call.
+
+        :param stage: stage that finished.
+        """
+        if not self._callbacks:
+            return
+        call = _current_call.get()
+        if call is not None:
+            fields.setdefault("endpoint", call.endpoint)
+        event = Event(stage, **fields)
+        for callback, stages in self._callbacks:
+            if stage in stages:
+                callback(event)
+
+    @contextlib.contextmanager
+    def call(self, endpoint):
+        """
+        Track one endpoint method call so its param building and frame construction are timed.
+
+        :param endpoint: endpoint method name, e.g. Team.team_lineups.
+        """
+        call = _Call(endpoint)
+        token = _current_call.set(call)
+        try:
+            yield call
+        finally:
+            _current_call.reset(token)
+
+    def requesting(self, method, params):
+        """
+        Mark the end of param building for the current call, called as the request starts.
+
+        :param method: stats.nba.com method requested.
+        :param params: params built for the request.
+        """
+        call = _current_call.get()
+        if call is None or call.requested is not None:
+            return
+        call.method = method
+        call.params = params
+        self.emit(
+            PARAMS, method=method, params=params, duration=time.perf_counter() - call.started
+        )
+        call.requested = time.perf_counter()
+
+    def requested(self):
+        """Mark the end of the request for the current call, frame construction is timed from here."""
+        call = _current_call.get()
+        if call is not None:
+            call.requested = time.perf_counter()
+
+
+def _rows(result):
+    if isinstance(result, dict):
+        # every result set of the payload, keyed by name.
+        return sum(len(df) for df in result.values() if hasattr(df, "__len__"))
+    return len(result) if hasattr(result, "__len__") else None
+
+
+def instrument(endpoint, func):
+    """
+    Wrap an endpoint method so calls to it emit params and frame events on the client hooks.
+
+    :param endpoint: endpoint method name, e.g. Team.team_lineups.
+    :param func: endpoint method.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        hooks = self.client.hooks
+        if not hooks.active:
+            return func(self, *args, **kwargs)
+        with hooks.call(endpoint) as call:
+            result = func(self, *args, **kwargs)
+            if call.requested is not None:
+                hooks.emit(
+                    FRAME,
+                    method=call.method,
+                    params=call.params,
+                    duration=time.perf_counter() - call.requested,
+                    rows=_rows(result),
+                )
+        return result
+
+    return wrapper
@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+import time
+import traceback
+
+from nba.exceptions import CircuitOpen
+from nba.utils import ThreadConnection
+
+
+DONE = "done"
+FAILED = "failed"
+
+
+class FileCheckpoint(object):
+    def __init__(self, path):
+        """
+        Checkpoint kept as an append only file of json lines, the last line of a unit wins.
+
+        :param path: location of the checkpoint file, created if missing.
+        :type path: str
+        """
+        self.path = path
+        self.status = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "rb+") as f:
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                if end < len(data):
+                    # last line cut short by a crash, dropped so the next record starts a new line.
+                    f.truncate(end)
+            for line in data[:end].decode("utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply(entry["unit"], entry["status"], entry.get("error"))
+
+    def _apply(self, unit, status, error):
+        self.status[unit] = status
+        if status == FAILED:
+            self.errors[unit] = error
+        else:
+            self.errors.pop(unit, None)
+
+    def record(self, unit, status, error=None):
+        """
+        :param unit: key of the unit.
+        :param status: DONE or FAILED.
+        :param error: description of the failure.
+        """
+        line = json.dumps({"unit": unit, "status": status, "error": error, "at": time.time()})
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(unit, status, error)
+
+    def done(self, unit):
+        return self.status.get(unit) == DONE
+
+    def failures(self):
+        """
+        :returns: error of every unit whose last attempt failed, keyed by unit.
+        :rtype: dict
+        """
+        return dict(self.errors)
+
+
+class SQLiteCheckpoint(object):
+    _connection = ThreadConnection()
+
+    def __init__(self, path, job="default"):
+        """
+        Checkpoint stored in a SQLite database, several jobs can share one database.
+
+        :param path: location of the database file.
+        :type path: str
+        :param job: name of the job, units are tracked per job.
+        :type job: str
+        """
+        self.path = path
+        self.job = job
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            "job TEXT, unit TEXT, status TEXT, error TEXT, updated REAL, PRIMARY KEY (job, unit))"
+        )
+
+    def record(self, unit, status, error=None):
+        """
+        :param unit: key of the unit.
+        :param status: DONE or FAILED.
+        :param error: description of the failure.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO units (job, unit, status, error, updated) VALUES (?, ?, ?, ?, ?)",
+            (self.job, unit, status, error, time.time()),
+        )
+
+    def done(self, unit):
+        row = self._connection.execute(
+            "SELECT status FROM units WHERE job = ? AND unit = ?", (self.job, unit)
+        ).fetchone()
+        return row is not None and row[0] == DONE
+
+    def failures(self):
+        """
+        :returns: error of every unit whose last attempt failed, keyed by unit.
+        :rtype: dict
+        """
+        return dict(
+            self._connection.execute(
+                "SELECT unit, error FROM units WHERE job = ? AND status = ?", (self.job, FAILED)
+            )
+        )
+
+
+class Job(object):
+    def __init__(self, units, func, checkpoint, key=str, abort_on=(CircuitOpen,)):
+        """
+        Run func over many units, recording each completed unit so a rerun after a failure or
+        a restart only does the units not done yet, the failed ones included.
+
+        :param units: iterable of units to process, e.g. player ids.
+        :param func: called with each unit, e.g. lambda pid: save(client.player.individual_shot_chart(pid, ...)).
+        :param checkpoint: nba.jobs.FileCheckpoint or nba.jobs.SQLiteCheckpoint, or a path to a
+            checkpoint file.
+        :param key: returns the string a unit is recorded under.
+        :param abort_on: exceptions stopping the whole job rather than failing the unit, by default
+            an open circuit since every following unit would fail the same way.
+        :type abort_on: tuple
+
+        """
+        self.units = units
+        self.func = func
+        if isinstance(checkpoint, str):
+            checkpoint = FileCheckpoint(checkpoint)
+        self.checkpoint = checkpoint
+        self.key = key
+        self.abort_on = abort_on
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def run(self, only_failed=False):
+        """
+        Process every unit not recorded as done, recording the outcome of each.
+
+        :param only_failed: only retry the units whose last attempt failed, skipping units never tried.
+        :type only_failed: bool
+        :returns: units failed in this run with their errors, keyed by unit.
+        :rtype: dict
+        :raises: any exception of abort_on, units finished before it stay recorded.
+        """
+        failures = {}
+        retry = self.checkpoint.failures() if only_failed else None
+        for unit in self.units:
+            key = self.key(unit)
+            if self.checkpoint.done(key) or (retry is not None and key not in retry):
+                self.skipped += 1
+                continue
+            try:
+                self.func(unit)
+            except self.abort_on:
+                raise
+            except Exception:
+                error = traceback.format_exc(limit=3)
+                self.checkpoint.record(key, FAILED, error)
+                failures[key] = error
+                self.failed += 1
+            else:
+                self.checkpoint.record(key, DONE)
+                self.completed += 1
+        return failures
@@ -0,0 +1,246 @@
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nba import hooks
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames, labels, extra=()):
+    pairs = list(zip(labelnames, labels)) + list(extra)
+    if not pairs:
+        return ""
+    return "{%s}" % ",".join('%s="%s"' % (name, _escape(value)) for name, value in pairs)
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter(object):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        :param name: metric name.
+        :param documentation: help text.
+        :param labelnames: names of the labels values are split by.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, value=1, *labels):
+        """
+        :param value: amount to add.
+        :param labels: label values, in labelnames order.
+        """
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + value
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self.values.items())
+        for labels, value in items:
+            yield self.name, _format_labels(self.labelnames, labels), value
+
+
+class Histogram(object):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        :param name: metric name.
+        :param documentation: help text.
+        :param labelnames: names of the labels observations are split by.
+        :param buckets: upper bounds of the buckets, +Inf is added.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        """
+        :param value: observed value.
+        :param labels: label values, in labelnames order.
+        """
+        with self._lock:
+            counts, total = self.values.get(labels, ([0] * len(self.buckets), 0.0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.values[labels] = (counts, total + value)
+
+    def quantile(self, q, *labels):
+        """
+        Estimate a quantile by linear interpolation within buckets, as Prometheus histogram_quantile does.
+
+        :param q: quantile between 0 and 1.
+        :param labels: label values, in labelnames order.
+        :returns: estimated value, None before any observation.
+        """
+        with self._lock:
+            counts, _ = self.values.get(labels, (None, None))
+        if not counts or not sum(counts):
+            return None
+        rank = q * sum(counts)
+        cumulative = 0
+        for idx, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                upper = self.buckets[idx]
+                lower = self.buckets[idx - 1] if idx else 0.0
+                if upper == float("inf"):
+                    return lower
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-2]
+
+    def samples(self):
+        with self._lock:
+            items = sorted((labels, (list(counts), total)) for labels, (counts, total) in self.values.items())
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield (
+                    self.name + "_bucket",
+                    _format_labels(self.labelnames, labels, [("le", _format_value(bound))]),
+                    cumulative,
+                )
+            yield self.name + "_sum", _format_labels(self.labelnames, labels), total
+            yield self.name + "_count", _format_labels(self.labelnames, labels), cumulative
+
+
+class Registry(object):
+    def __init__(self):
+        """Collection of metrics rendered together in the Prometheus text format."""
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self):
+        """
+        :returns: every metric in the Prometheus text exposition format.
+        :rtype: str
+        """
+        lines = []
+        for metric in self.metrics:
+            lines.append("# HELP %s %s" % (metric.name, metric.documentation))
+            lines.append("# TYPE %s %s" % (metric.name, metric.kind))
+            for name, labels, value in metric.samples():
+                lines.append("%s%s %s" % (name, labels, _format_value(value)))
+        return "\n".join(lines) + "\n"
+
+
+class ClientMetrics(object):
+    def __init__(self, registry=None):
+        """
+        Request, latency, byte, retry, cache and row metrics collected from client hook events.
+
+        :param registry: registry to add the metrics to, a new one by default.
+        :type registry: nba.metrics.Registry
+        """
+        self.registry = registry or Registry()
+        self.requests = self.registry.counter(
+            "nba_requests_total", "HTTP requests sent.", ("endpoint", "method", "status")
+        )
+        self.latency = self.registry.histogram(
+            "nba_stage_duration_seconds",
+            "Time spent in each stage of an endpoint call.",
+            ("endpoint", "stage"),
+        )
+        self.wire_bytes = self.registry.counter(
+            "nba_response_wire_bytes_total", "Response bytes read from the network.", ("endpoint",)
+        )
+        self.decoded_bytes = self.registry.counter(
+            "nba_response_decoded_bytes_total", "Response bytes after decompression.", ("endpoint",)
+        )
+        self.retries = self.registry.counter(
+            "nba_retries_total", "Requests retried.", ("endpoint", "method", "status")
+        )
+        self.cache = self.registry.counter(
+            "nba_cache_lookups_total", "Response cache lookups.", ("endpoint", "result")
+        )
+        self.rows = self.registry.counter(
+            "nba_rows_parsed_total", "Rows parsed into data frames.", ("endpoint",)
+        )
+
+    def __call__(self, event):
+        endpoint = event.endpoint or ""
+        if event.stage == hooks.HTTP:
+            self.requests.inc(1, endpoint, event.method or "", str(event.status or "error"))
+            if event.nbytes is not None:
+                self.wire_bytes.inc(event.nbytes, endpoint)
+        elif event.stage == hooks.DECODE and event.nbytes is not None:
+            self.decoded_bytes.inc(event.nbytes, endpoint)
+        elif event.stage == hooks.RETRY:
+            self.retries.inc(1, endpoint, event.method or "", str(event.status or "error"))
+            return
+        elif event.stage == hooks.CACHE:
+            self.cache.inc(1, endpoint, "hit" if event.hit else "miss")
+            return
+        elif event.stage == hooks.FRAME and event.rows is not None:
+            self.rows.inc(event.rows, endpoint)
+        if event.duration is not None:
+            self.latency.observe(event.duration, endpoint, event.stage)
+
+    def render(self):
+        """
+        :returns: metrics in the Prometheus text exposition format.
+        :rtype: str
+        """
+        return self.registry.render()
+
+
+def start_http_server(registry, port=9100, addr="127.0.0.1"):
+    """
+    Serve the registry on /metrics from a background thread.
+
+    :param registry: nba.metrics.Registry or nba.metrics.ClientMetrics to expose.
+    :param port: port to listen on, 0 picks a free port.
+    :param addr: interface to listen on.
+    :returns: the running server, call shutdown() to stop it.
+    :rtype: http.server.ThreadingHTTPServer
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,136 @@
+import threading
+import time
+
+from nba.utils import ThreadConnection
+
+
+class _BaseBucket(object):
+    def __init__(self, rate, capacity=None):
+        """
+        :param rate: tokens added per second, i.e. sustained requests per second.
+        :type rate: float
+        :param capacity: maximum tokens held, i.e. largest burst allowed. Defaults to max(1, rate).
+        :type capacity: float
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+
+    def _refill(self, tokens, updated, now):
+        return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def _take(self, tokens):
+        """Take tokens if available, returns 0 on success or the seconds to wait before retrying."""
+        raise NotImplementedError
+
+    def try_acquire(self, tokens=1):
+        """
+        Take tokens without waiting.
+
+        :param tokens: number of tokens to take.
+        :returns: whether the tokens were taken.
+        :rtype: bool
+        """
+        return self._take(tokens) == 0
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Block until tokens are available.
+
+        :param tokens: number of tokens to take.
+        :param timeout: maximum seconds to wait, None waits indefinitely.
+        :returns: whether the tokens were taken before the timeout.
+        :rtype: bool
+        """
+        if tokens > self.capacity:
+            raise ValueError("cannot take more tokens than the bucket capacity")
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take(tokens)
+            if wait == 0:
+                return True
+            if end is not None:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class TokenBucket(_BaseBucket):
+    def __init__(self, rate, capacity=None):
+        """
+        Token bucket shared by every thread of one process.
+
+        :param rate: tokens added per second, i.e. sustained requests per second.
+        :type rate: float
+        :param capacity: maximum tokens held, i.e. largest burst allowed. Defaults to max(1, rate).
+        :type capacity: float
+        """
+        super(TokenBucket, self).__init__(rate, capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = self._refill(self.tokens, self.updated, now)
+            self.updated = now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0
+            return (tokens - self.tokens) / self.rate
+
+
+class SQLiteTokenBucket(_BaseBucket):
+    _connection = ThreadConnection(journal_mode=None)
+
+    def __init__(self, path, rate, capacity=None, name="stats.nba.com"):
+        """
+        Token bucket whose state lives in a SQLite database, shared by every process using the same file.
+
+        :param path: location of the database file.
+        :type path: str
+        :param rate: tokens added per second, i.e. sustained requests per second.
+        :type rate: float
+        :param capacity: maximum tokens held, i.e. largest burst allowed. Defaults to max(1, rate).
+        :type capacity: float
+        :param name: bucket name, several buckets can share one database.
+        :type name: str
+        """
+        super(SQLiteTokenBucket, self).__init__(rate, capacity)
+        self.path = path
+        self.name = name
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+        )
+        self._connection.execute(
+            "INSERT OR IGNORE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+            (self.name, self.capacity, time.time()),
+        )
+
+    def _take(self, tokens):
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            stored, updated = connection.execute(
+                "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            now = time.time()
+            available = self._refill(stored, min(updated, now), now)
+            wait = 0
+            if available >= tokens:
+                available -= tokens
+            else:
+                wait = (tokens - available) / self.rate
+            connection.execute(
+                "UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?",
+                (available, now, self.name),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return wait
@@ -0,0 +1,151 @@
+import email.utils
+import random
+import threading
+import time
+from collections import deque
+
+from nba.utils import status_matches
+
+
+RETRY_STATUS_CODES = (400, 429, "5xx")
+
+
+class RetryBudget(object):
+    def __init__(self, ratio=0.2, min_per_second=1.0, window=10.0):
+        """
+        Cap retries to a share of recent requests so retries cannot amplify load during an outage.
+
+        :param ratio: retries allowed per request sent within the window.
+        :type ratio: float
+        :param min_per_second: retries always allowed per second, so low traffic can still retry.
+        :type min_per_second: float
+        :param window: seconds of history the budget is computed over.
+        :type window: float
+
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now):
+        for events in (self._requests, self._retries):
+            while events and events[0] < now - self.window:
+                events.popleft()
+
+    def record_request(self):
+        """Record a first attempt, which earns retry budget."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_spend(self):
+        """
+        Spend budget on a retry.
+
+        :returns: whether the retry is allowed.
+        :rtype: bool
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy(object):
+    def __init__(
+        self,
+        retries=2,
+        status_codes=RETRY_STATUS_CODES,
+        backoff=0.5,
+        max_backoff=30.0,
+        jitter=True,
+        respect_retry_after=True,
+        budget=None,
+    ):
+        """
+        Decide whether and when failed requests are retried.
+
+        :param retries: maximum retries per request.
+        :type retries: int
+        :param status_codes: status codes to retry, either ints or classes like "5xx".
+        :type status_codes: tuple
+        :param backoff: base delay in seconds, doubled on each retry.
+        :type backoff: float
+        :param max_backoff: upper bound on a single delay in seconds.
+        :type max_backoff: float
+        :param jitter: draw each delay uniformly between 0 and the exponential delay.
+        :type jitter: bool
+        :param respect_retry_after: wait as long as the Retry-After header asks, capped by max_backoff.
+        :type respect_retry_after: bool
+        :param budget: budget shared by every request of a client, defaults to a new RetryBudget.
+        :type budget: nba.retry.RetryBudget
+
+        """
+        self.retries = retries
+        self.status_codes = status_codes
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.budget = budget or RetryBudget()
+
+    def is_retryable_status(self, status_code):
+        """
+        :param status_code: response status code.
+        :returns: whether the status code belongs to the retried codes or classes.
+        :rtype: bool
+        """
+        return status_matches(status_code, self.status_codes)
+
+    def should_retry(self, attempt, response=None):
+        """
+        :param attempt: number of retries already made.
+        :param response: response received, None when the request raised a connection error or timeout.
+        :returns: whether the request should be sent again, spends budget when it should.
+        :rtype: bool
+        """
+        if attempt >= self.retries:
+            return False
+        if response is not None and not self.is_retryable_status(response.status_code):
+            return False
+        return self.budget.try_spend()
+
+    def delay(self, attempt, response=None):
+        """
+        :param attempt: number of retries already made.
+        :param response: response received, used for its Retry-After header.
+        :returns: seconds to wait before the next attempt.
+        :rtype: float
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(self.max_backoff, retry_after)
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(value):
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
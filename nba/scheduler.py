@@ -0,0 +1,154 @@
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+
+
+LIVE = 0
+INTERACTIVE = 1
+BACKFILL = 2
+PRIORITIES = {"live": LIVE, "interactive": INTERACTIVE, "backfill": BACKFILL}
+
+_priority = contextvars.ContextVar("nba_priority", default=INTERACTIVE)
+
+
+@contextlib.contextmanager
+def priority(level):
+    """
+    Run every request made inside the block at the given priority class.
+
+    Threads and tasks started with a copy of the current context, as fetch_many and
+    AsyncAPIClient do, keep the priority.
+
+    :param level: LIVE, INTERACTIVE or BACKFILL, or their names, lower values go first.
+        None leaves the current priority unchanged.
+    """
+    if level is None:
+        yield
+        return
+    token = _priority.set(PRIORITIES.get(level, level))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current():
+    """
+    :returns: priority class of the calling context, INTERACTIVE unless set.
+    :rtype: int
+    """
+    return _priority.get()
+
+
+class PriorityScheduler(object):
+    def __init__(self, rate_limiter, poll_interval=None):
+        """
+        Hand out the tokens of one rate limiter by priority class, so queued backfill requests
+        never hold up live ones. Requests of the same class are served in arrival order.
+
+        Pass it to the client as its rate_limiter and mark work with nba.scheduler.priority.
+
+        :param rate_limiter: limiter shared by every priority class, e.g. nba.ratelimit.TokenBucket.
+        :param poll_interval: seconds the head of the queue waits between attempts at the limiter,
+            defaults to the interval between two tokens.
+        :type poll_interval: float
+
+        """
+        self.rate_limiter = rate_limiter
+        rate = getattr(rate_limiter, "rate", None)
+        self.poll_interval = poll_interval or (1.0 / rate if rate else 0.01)
+        self.granted = dict((level, 0) for level in PRIORITIES.values())
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._acquiring = False
+
+    @property
+    def waiting(self):
+        """Number of requests queued per priority class."""
+        with self._condition:
+            counts = dict((level, 0) for level in PRIORITIES.values())
+            for level, _ in self._queue:
+                counts[level] = counts.get(level, 0) + 1
+            return counts
+
+    def try_acquire(self, tokens=1):
+        """
+        Take tokens without waiting, only when no request is queued ahead.
+
+        :param tokens: number of tokens to take.
+        :returns: whether the tokens were taken.
+        :rtype: bool
+        """
+        with self._condition:
+            if self._queue and self._queue[0][0] <= current():
+                return False
+        # the limiter may block, e.g. SQLiteTokenBucket on a busy database, so it is called
+        # without holding the lock.
+        if not self.rate_limiter.try_acquire(tokens):
+            return False
+        with self._condition:
+            self._grant(current())
+        return True
+
+    def acquire(self, tokens=1, timeout=None):
+        """
+        Block until every request of a higher priority class, or queued earlier in the same one,
+        has been served and tokens are available.
+
+        :param tokens: number of tokens to take.
+        :param timeout: maximum seconds to wait, None waits indefinitely.
+        :returns: whether the tokens were taken before the timeout.
+        :rtype: bool
+        """
+        level = current()
+        entry = (level, next(self._sequence))
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+        try:
+            while True:
+                with self._condition:
+                    # only the head of the queue goes to the limiter, one call at a time.
+                    while self._queue[0] != entry or self._acquiring:
+                        if not self._wait(end):
+                            return False
+                    self._acquiring = True
+                acquired = False
+                try:
+                    acquired = self.rate_limiter.try_acquire(tokens)
+                finally:
+                    with self._condition:
+                        self._acquiring = False
+                        if acquired:
+                            self._queue.remove(entry)
+                            heapq.heapify(self._queue)
+                            self._grant(level)
+                        self._condition.notify_all()
+                if acquired:
+                    return True
+                with self._condition:
+                    if not self._wait(end, self.poll_interval):
+                        return False
+        finally:
+            with self._condition:
+                if entry in self._queue:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                    self._condition.notify_all()
+
+    def _wait(self, end, wait=None):
+        # waits on the condition, False once the timeout ending at end has passed.
+        if end is not None:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return False
+            wait = remaining if wait is None else min(wait, remaining)
+        self._condition.wait(wait)
+        return True
+
+    def _grant(self, level):
+        self.granted[level] = self.granted.get(level, 0) + 1
@@ -0,0 +1,213 @@
+import fnmatch
+
+import numpy as np
+
+
+CATEGORY = "category"
+
+# columns repeated across rows, stored once per distinct value as categoricals.
+CATEGORICAL_COLUMNS = (
+    "game_id",
+    "game_date",
+    "team_abbreviation",
+    "team_city",
+    "team_name",
+    "team_nickname",
+    "*_team_abbreviation",
+    "*_team_city",
+    "*_team_name",
+    "player_name",
+    "start_position",
+    "matchup",
+    "wl",
+    "season_id",
+    "season_year",
+    "group_set",
+    "group_value",
+    "action_type",
+    "shot_type",
+    "shot_zone_*",
+    "event_type",
+    "grid_type",
+    "position",
+    "nickname",
+    "comment",
+)
+
+# declared dtypes per stats.nba.com method and result set, taking precedence over the defaults.
+SCHEMAS = {
+    ("boxscoretraditionalv2", "PlayerStats"): {
+        "team_id": "int32",
+        "player_id": "int32",
+        "fgm": "float32",
+        "fga": "float32",
+        "fg3m": "float32",
+        "fg3a": "float32",
+        "ftm": "float32",
+        "fta": "float32",
+        "oreb": "float32",
+        "dreb": "float32",
+        "reb": "float32",
+        "ast": "float32",
+        "stl": "float32",
+        "blk": "float32",
+        "to": "float32",
+        "pf": "float32",
+        "pts": "float32",
+        "plus_minus": "float32",
+    },
+    ("boxscoretraditionalv2", "TeamStats"): {"team_id": "int32"},
+    ("shotchartdetail", "Shot_Chart_Detail"): {
+        "game_event_id": "int16",
+        "period": "int8",
+        "minutes_remaining": "int8",
+        "seconds_remaining": "int8",
+        "shot_distance": "int16",
+        "loc_x": "int16",
+        "loc_y": "int16",
+        "shot_attempted_flag": "int8",
+        "shot_made_flag": "int8",
+        "htm": CATEGORY,
+        "vtm": CATEGORY,
+    },
+    ("playbyplayv2", "PlayByPlay"): {
+        "eventnum": "int16",
+        "eventmsgtype": "int8",
+        "eventmsgactiontype": "int16",
+        "period": "int8",
+        "person1type": "float32",
+        "person2type": "float32",
+        "person3type": "float32",
+    },
+}
+
+
+class SchemaRegistry(object):
+    def __init__(self, schemas=None, categorical=CATEGORICAL_COLUMNS):
+        """
+        Compact dtypes for the frames of each stats.nba.com method and result set.
+
+        Declared dtypes are applied first, then ids and counts fitting in int32 become int32,
+        floats like percentages become float32 unless it changes whole numbers or other values
+        beyond a relative 1e-6, ids with nulls become nullable Int32 and repeated labels like team
+        abbreviations become categoricals.
+
+        :param schemas: declared dtypes keyed by (method, result set name), merged over SCHEMAS,
+            e.g. {("leaguegamelog", "LeagueGameLog"): {"game_id": "category"}}.
+        :type schemas: dict
+        :param categorical: lowercase column names, shell style patterns allowed, made categorical.
+        :type categorical: tuple
+
+        """
+        self.schemas = dict(SCHEMAS)
+        for key, dtypes in (schemas or {}).items():
+            self.register(key[0], key[1], dtypes)
+        self.categorical = categorical
+
+    def register(self, method, result_set, dtypes):
+        """
+        :param method: stats.nba.com method, e.g. boxscoretraditionalv2.
+        :param result_set: result set name, e.g. PlayerStats.
+        :param dtypes: dtype per lowercase column name.
+        """
+        self.schemas[(method, result_set)] = dict(
+            self.schemas.get((method, result_set), {}), **dtypes
+        )
+
+    def dtypes_for(self, method, result_set, df):
+        """
+        :param method: stats.nba.com method the frame came from.
+        :param result_set: name of the result set the frame was built from.
+        :param df: frame as built from the payload.
+        :returns: compact dtype per column.
+        :rtype: dict
+        """
+        declared = self.schemas.get((method, result_set), {})
+        dtypes = {}
+        for column, dtype in df.dtypes.items():
+            if column in declared:
+                dtypes[column] = declared[column]
+            elif dtype.kind == "i":
+                dtypes[column] = _int_dtype(df[column])
+            elif dtype.kind == "f":
+                float_dtype = _float_dtype(column, df[column])
+                if float_dtype is not None:
+                    dtypes[column] = float_dtype
+            elif dtype.kind in "OU" or str(dtype) == "str":
+                if any(fnmatch.fnmatchcase(column, pattern) for pattern in self.categorical):
+                    dtypes[column] = CATEGORY
+        return dtypes
+
+    def apply(self, df, method, result_set):
+        """
+        :param df: frame as built from the payload.
+        :param method: stats.nba.com method the frame came from.
+        :param result_set: name of the result set the frame was built from.
+        :returns: the frame with compact dtypes, columns that cannot be converted keep theirs.
+        :rtype: Dataframe
+        """
+        if not df.columns.is_unique:
+            return df
+        for column, dtype in self.dtypes_for(method, result_set, df).items():
+            if str(df[column].dtype) == dtype:
+                continue
+            try:
+                df[column] = _convert(df[column], dtype)
+            except (TypeError, ValueError, OverflowError):
+                # nulls in an int column or values not matching the declared dtype.
+                pass
+        return df
+
+
+def _int_dtype(series):
+    if series.empty:
+        return "int32"
+    info = np.iinfo(np.int32)
+    if info.min <= series.min() and series.max() <= info.max:
+        return "int32"
+    return str(series.dtype)
+
+
+def _is_id(column):
+    return column == "id" or column.endswith("_id")
+
+
+def _float_dtype(column, series):
+    # ids arrive as floats when a row has none, float32 would round ids like 1610612737.
+    if _is_id(column):
+        values = series.dropna()
+        if values.empty:
+            return "Int32"
+        info = np.iinfo(np.int32)
+        if (values % 1 == 0).all() and info.min <= values.min() and values.max() <= info.max:
+            return "Int32"
+        return None
+    if _fits_float32(series):
+        return "float32"
+    return None
+
+
+def _fits_float32(series, rtol=1e-6):
+    # percentages like 0.456 keep about 7 significant digits, whole numbers must stay exact.
+    values = series.to_numpy(dtype=np.float64)
+    with np.errstate(over="ignore"):
+        # values beyond the float32 range become inf and fail the comparison.
+        rounded = values.astype(np.float32).astype(np.float64)
+    whole = values % 1 == 0
+    return np.array_equal(rounded[whole], values[whole]) and np.allclose(
+        rounded, values, rtol=rtol, atol=0, equal_nan=True
+    )
+
+
+def _convert(series, dtype):
+    if dtype.startswith("int") and series.dtype.kind == "f":
+        # integer counts arrive as floats when a row has nulls, refuse to round them.
+        if series.isnull().any() or (series % 1 != 0).any():
+            raise ValueError("cannot store %s as %s" % (series.name, dtype))
+    if dtype == "float32" and series.dtype.kind == "f" and not _fits_float32(series):
+        raise ValueError("%s loses precision as float32" % series.name)
+    if dtype.startswith("int"):
+        info = np.iinfo(dtype)
+        if len(series) and (series.min() < info.min or series.max() > info.max):
+            raise OverflowError("%s does not fit %s" % (series.name, dtype))
+    return series.astype(dtype)
@@ -0,0 +1,316 @@
+"""
+Local stand-in for stats.nba.com and the other hosts used by the endpoints, for load and latency testing.
+
+Run with `python -m nba.server --port 8000 --latency 0.05 --max-rps 20` or in process::
+
+    with StandInServer(latency=0.05) as server:
+        client = server.point(APIClient())
+        client.boxscores.traditional("0021900001", 0)
+
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from nba.ratelimit import TokenBucket
+
+
+HEADERS = [
+    "GAME_ID",
+    "TEAM_ID",
+    "TEAM_ABBREVIATION",
+    "TEAM_CITY",
+    "PLAYER_ID",
+    "PLAYER_NAME",
+    "START_POSITION",
+    "MIN",
+    "FGM",
+    "FGA",
+    "FG_PCT",
+    "FG3M",
+    "FG3A",
+    "FG3_PCT",
+    "FTM",
+    "FTA",
+    "FT_PCT",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TO",
+    "PF",
+    "PTS",
+    "PLUS_MINUS",
+]
+TEAMS = [("1610612737", "ATL", "Atlanta"), ("1610612738", "BOS", "Boston")]
+
+# methods whose payload uses the singular resultSet key, as a single dict or a list.
+SINGLE_RESULT_SET = {"leagueleaders": dict, "leaderstiles": list}
+
+
+def synthetic_row(idx):
+    team_id, abbreviation, city = TEAMS[idx % len(TEAMS)]
+    fga = 5 + idx % 15
+    fgm = fga // 2
+    return [
+        "00219%05d" % (idx // 26),
+        int(team_id),
+        abbreviation,
+        city,
+        200000 + idx,
+        "Player %d" % idx,
+        "FGC"[idx % 3],
+        "%d:%02d" % (10 + idx % 30, idx % 60),
+        fgm,
+        fga,
+        round(fgm / fga, 3),
+        idx % 5,
+        idx % 9,
+        round((idx % 5) / 9.0, 3),
+        idx % 7,
+        idx % 8,
+        None if idx % 8 == 0 else round((idx % 7) / float(idx % 8 or 1), 3),
+        idx % 12,
+        idx % 10,
+        idx % 4,
+        idx % 3,
+        idx % 5,
+        idx % 6,
+        2 * fgm + idx % 7,
+        idx % 21 - 10,
+    ]
+
+
+def synthetic_stats(method, rows, result_sets):
+    """
+    :param method: stats.nba.com method requested.
+    :param rows: rows per result set.
+    :param result_sets: number of result sets in the payload.
+    :returns: payload shaped like stats.nba.com responses.
+    :rtype: dict
+    """
+    row_set = [synthetic_row(idx) for idx in range(rows)]
+    sets = [
+        {"name": "ResultSet%d" % idx, "headers": HEADERS, "rowSet": row_set}
+        for idx in range(result_sets)
+    ]
+    kind = SINGLE_RESULT_SET.get(method)
+    if kind is dict:
+        return {"resource": method, "resultSet": sets[0]}
+    if kind is list:
+        return {"resource": method, "resultSet": sets}
+    return {"resource": method, "parameters": {}, "resultSets": sets}
+
+
+def synthetic_play_by_play(rows):
+    events = [
+        {"period": 1, "gameClock": "%02d:00" % (idx % 12), "description": "Event %d" % idx}
+        for idx in range(rows)
+    ]
+    return {"payload": {"playByPlays": [{"events": events}]}}
+
+
+def synthetic_cms(rows):
+    items = [dict(zip(HEADERS, synthetic_row(idx))) for idx in range(rows)]
+    return {"results": items, "ListItems": items}
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class StandInServer(object):
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        jitter=0.0,
+        max_rps=None,
+        error_rate=0.0,
+        rows=50,
+        result_sets=10,
+        cassette=None,
+    ):
+        """
+        :param host: interface to listen on.
+        :type host: str
+        :param port: port to listen on, 0 picks a free port.
+        :type port: int
+        :param latency: seconds added to every response.
+        :type latency: float
+        :param jitter: extra uniformly random seconds added to every response.
+        :type jitter: float
+        :param max_rps: requests per second served before answering 429 with Retry-After, None for no limit.
+        :type max_rps: float
+        :param error_rate: share of requests answered with a 500.
+        :type error_rate: float
+        :param rows: rows per synthetic result set, controls payload size.
+        :type rows: int
+        :param result_sets: result sets per synthetic stats payload.
+        :type result_sets: int
+        :param cassette: nba.cassette.Cassette whose recorded bodies are served as fixtures, by url path.
+        :type cassette: nba.cassette.Cassette
+
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.limiter = TokenBucket(max_rps) if max_rps else None
+        self.error_rate = error_rate
+        self.rows = rows
+        self.result_sets = result_sets
+        self.fixtures = self._load_fixtures(cassette) if cassette else {}
+        self._bodies = {}
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @staticmethod
+    def _load_fixtures(cassette):
+        fixtures = {}
+        for key in cassette.keys():
+            response = cassette.play(key)
+            if response.status_code == 200:
+                fixtures.setdefault(urlparse(response.url).path, response.content)
+        return fixtures
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return "http://%s:%s" % (host, port)
+
+    def point(self, client):
+        """
+        Send every request of the client to this server.
+
+        :param client: API client.
+        :returns: the client.
+        """
+        client.url = "%s/stats/" % self.url
+        client.global_url = "%s/stats2/" % self.url
+        client.cms_url = "%s/wp-json/statscms/v1/" % self.url
+        return client
+
+    def body(self, path):
+        """
+        :param path: url path requested.
+        :returns: response body for the path.
+        :rtype: bytes
+        """
+        if path in self.fixtures:
+            return self.fixtures[path]
+        body = self._bodies.get(path)
+        if body is None:
+            body = self._bodies[path] = self._synthetic_body(path)
+        return body
+
+    def _synthetic_body(self, path):
+        if path.startswith("/stats2/"):
+            payload = synthetic_play_by_play(self.rows)
+        elif path.startswith("/wp-json/"):
+            payload = synthetic_cms(self.rows)
+        else:
+            method = path.rstrip("/").rsplit("/", 1)[-1]
+            payload = synthetic_stats(method, self.rows, self.result_sets)
+        return json.dumps(payload).encode("utf-8")
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                # clients send a json body with GETs, drain it to keep the connection usable.
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                with server._lock:
+                    server.requests += 1
+                if server.limiter is not None and not server.limiter.try_acquire():
+                    with server._lock:
+                        server.throttled += 1
+                    return self._send(429, b"{}", {"Retry-After": "1"})
+                delay = server.latency + random.uniform(0, server.jitter)
+                if delay:
+                    time.sleep(delay)
+                if server.error_rate and random.random() < server.error_rate:
+                    return self._send(500, b"{}")
+                self._send(200, server.body(urlparse(self.path).path))
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=50)
+    parser.add_argument("--result-sets", type=int, default=10)
+    parser.add_argument("--cassette", default=None)
+    args = parser.parse_args(argv)
+    cassette = None
+    if args.cassette:
+        from nba.cassette import Cassette
+
+        cassette = Cassette(args.cassette)
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        max_rps=args.max_rps,
+        error_rate=args.error_rate,
+        rows=args.rows,
+        result_sets=args.result_sets,
+        cassette=cassette,
+    )
+    print("serving stats.nba.com stand-in on %s" % server.url)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
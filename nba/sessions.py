@@ -0,0 +1,104 @@
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionRegistry(object):
+    def __init__(self, pool_connections=10, pool_maxsize=10, max_retries=1, hosts=None):
+        """
+        Keep-alive requests sessions per host and thread, since a session is not safe to share
+        between threads. The sessions of every thread mount the same adapter for a host, so they
+        draw on one connection pool rather than each thread opening its own.
+
+        :param pool_connections: number of connection pools cached per adapter.
+        :type pool_connections: int
+        :param pool_maxsize: maximum connections kept alive to each host, size it to the number
+            of threads calling the host at once.
+        :type pool_maxsize: int
+        :param max_retries: connection level retries done by the adapter.
+        :type max_retries: int
+        :param hosts: per host overrides of the adapter settings,
+            e.g. {"stats.nba.com": {"pool_maxsize": 32}}.
+        :type hosts: dict
+
+        """
+        self.defaults = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "max_retries": max_retries,
+        }
+        self.hosts = hosts or {}
+        self._adapters = {}
+        self._created = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def _sessions(self):
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        return sessions
+
+    def session_for(self, url):
+        """
+        :param url: url the session will be used for.
+        :returns: keep-alive session of the calling thread for the url host.
+        :rtype: requests.Session
+        """
+        host = urlparse(url).netloc
+        session = self._sessions.get(host)
+        if session is None:
+            session = self._sessions[host] = self.create_session(host)
+        return session
+
+    def set_session(self, url, session):
+        """
+        Use the given session for the url host on the calling thread.
+
+        :param url: url whose host the session serves.
+        :param session: requests session to use.
+        """
+        self._sessions[urlparse(url).netloc] = session
+
+    def adapter_for(self, host):
+        """
+        :param host: host the adapter talks to.
+        :returns: adapter holding the connection pool of the host, shared by every thread.
+        :rtype: requests.adapters.HTTPAdapter
+        """
+        with self._lock:
+            adapter = self._adapters.get(host)
+            if adapter is None:
+                adapter = self._adapters[host] = HTTPAdapter(
+                    **dict(self.defaults, **self.hosts.get(host, {}))
+                )
+            return adapter
+
+    def create_session(self, host):
+        """
+        :param host: host the session will talk to.
+        :returns: new session with the shared adapter of the host mounted.
+        :rtype: requests.Session
+        """
+        adapter = self.adapter_for(host)
+        session = requests.Session()
+        session.mount("http://%s" % host, adapter)
+        session.mount("https://%s" % host, adapter)
+        with self._lock:
+            self._created.append(session)
+        return session
+
+    def close(self):
+        """Close the sessions of every thread and the connections they keep alive."""
+        with self._lock:
+            sessions, self._created = self._created, []
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+        for session in sessions:
+            session.close()
+        for adapter in adapters:
+            adapter.close()
+        self._local = threading.local()
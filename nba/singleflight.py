@@ -0,0 +1,56 @@
+import threading
+
+from nba import deadlines
+from nba.exceptions import DeadlineExceeded
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.duplicates = 0
+
+
+class SingleFlight(object):
+    def __init__(self):
+        """
+        Coalesce identical calls made concurrently, the first caller runs and the others share its outcome.
+        """
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """
+        Run func once for every caller asking for key at the same time.
+
+        :param key: identifies duplicate calls.
+        :param func: function to run.
+        :returns: result of func, shared with every concurrent duplicate.
+        :raises: whatever func raised, in every concurrent duplicate.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.duplicates += 1
+                self.coalesced += 1
+        if not leader:
+            if not call.done.wait(timeout=deadlines.remaining()):
+                raise DeadlineExceeded("deadline exceeded waiting on in-flight request")
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
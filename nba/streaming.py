@@ -0,0 +1,131 @@
+import re
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+available = ijson is not None
+
+_RESULT_SET = re.compile(r"^(resultSets?)(\.item)?\.(name|headers|rowSet)(\.item)?(\.item)?")
+_SCALARS = ("string", "number", "boolean", "null")
+_OTHER, _NAME, _HEADER, _ROW, _CELL = range(5)
+
+
+def _classify(prefix):
+    match = _RESULT_SET.match(prefix)
+    if match is None or match.group(0) != prefix:
+        return _OTHER
+    field, in_row, in_cell = match.group(3), match.group(4), match.group(5)
+    if field == "name" and not in_row:
+        return _NAME
+    if field == "headers" and in_row and not in_cell:
+        return _HEADER
+    if field == "rowSet" and in_row:
+        return _CELL if in_cell else _ROW
+    return _OTHER
+
+
+class CountingReader(object):
+    def __init__(self, raw):
+        """
+        :param raw: file like object to read from, counting the bytes read.
+        """
+        self.raw = raw
+        self.nbytes = 0
+
+    def read(self, size=-1):
+        chunk = self.raw.read(size)
+        self.nbytes += len(chunk)
+        return chunk
+
+
+class _ResultSet(object):
+    def __init__(self):
+        self.name = None
+        self.headers = []
+        self.columns = []
+        self.rows = 0
+
+    def column(self, idx):
+        while len(self.columns) <= idx:
+            self.columns.append([None] * self.rows)
+        return self.columns[idx]
+
+    def to_json(self):
+        for column in self.columns:
+            column.extend([None] * (self.rows - len(column)))
+        return {
+            "name": self.name,
+            "headers": self.headers,
+            "columns": self.columns,
+            "rowCount": self.rows,
+        }
+
+
+def parse_result_sets(stream):
+    """
+    Parse a stats.nba.com payload incrementally, appending every rowSet straight into column lists
+    so neither the full text nor the row lists are held in memory.
+
+    :param stream: file like object yielding the raw json payload.
+    :returns: payload with resultSets (or resultSet) whose sets hold columns instead of rowSet.
+    :rtype: dict
+
+    """
+    if ijson is None:
+        raise ImportError("streaming parsing requires the ijson package")
+    result_key = "resultSets"
+    as_list = True
+    sets = []
+    current = None
+    col = 0
+    builder = None
+    kinds = {}
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            # nested value inside a row cell, rebuilt whole.
+            builder.event(event, value)
+            if prefix == cell_prefix and event in ("end_map", "end_array"):
+                current.column(col).append(builder.value)
+                col += 1
+                builder = None
+            continue
+        kind = kinds.get(prefix)
+        if kind is None:
+            kind = kinds[prefix] = _classify(prefix)
+        if kind is _OTHER:
+            if prefix in ("resultSets", "resultSet") and event in ("start_map", "start_array"):
+                result_key = prefix
+                as_list = event == "start_array"
+                if not as_list:
+                    current = _ResultSet()
+            elif prefix in ("resultSets.item", "resultSet.item"):
+                if event == "start_map":
+                    current = _ResultSet()
+                elif event == "end_map":
+                    sets.append(current)
+            continue
+        if kind is _CELL:
+            if event in _SCALARS:
+                current.column(col).append(value)
+                col += 1
+            elif event in ("start_map", "start_array"):
+                cell_prefix = prefix
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+        elif kind is _ROW:
+            if event == "start_array":
+                col = 0
+            elif event == "end_array":
+                current.rows += 1
+                for column in current.columns[col:]:
+                    column.append(None)
+        elif kind is _NAME and event == "string":
+            current.name = value
+        elif kind is _HEADER and event in _SCALARS:
+            current.headers.append(value)
+    if not as_list and current is not None:
+        return {result_key: current.to_json()}
+    return {result_key: [result_set.to_json() for result_set in sets]}
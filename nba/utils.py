@@ -1,4 +1,7 @@
 import datetime
+import sqlite3
+import threading
+
 from nba.exceptions import ApiError
 
 
@@ -55,15 +58,68 @@ def clean_param_key(key):
     )
 
 
-def check_status_code(response, codes=None):
+def check_status_code(response, codes=None, loads=None):
     """Checks response.status_code is in codes
     :param response: Requests response
     :param codes: List of accepted codes or callable
+    :param loads: json decoder used to read the error message
     :raises: StatusCodeError if code invalid
     """
     codes = codes or [200]
     if response.status_code not in codes:
-        raise ApiError(response)
+        raise ApiError(response, loads=loads)
+
+
+def status_matches(status_code, codes):
+    """
+    :param status_code: response status code.
+    :param codes: status codes, or classes given as strings, e.g. (429, "5xx").
+    :returns: whether the status code is one of the codes or belongs to one of the classes.
+    :rtype: bool
+    """
+    for code in codes:
+        if isinstance(code, str):
+            if str(status_code)[0] == code[0]:
+                return True
+        elif status_code == code:
+            return True
+    return False
+
+
+class ThreadConnection(object):
+    def __init__(self, timeout=30, journal_mode="WAL"):
+        """
+        Class attribute giving each thread its own autocommit connection to the SQLite database
+        at the path attribute of the instance, sqlite3 connections cannot be shared by threads.
+
+        :param timeout: seconds to wait on a database locked by another connection.
+        :type timeout: float
+        :param journal_mode: journal mode set on each connection, None keeps the database default.
+            A journal_mode attribute of the instance takes precedence.
+        :type journal_mode: str
+
+        """
+        self.timeout = timeout
+        self.journal_mode = journal_mode
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = "_%s_local" % name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        local = instance.__dict__.setdefault(self.name, threading.local())
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                instance.path, timeout=self.timeout, isolation_level=None
+            )
+            journal_mode = getattr(instance, "journal_mode", self.journal_mode)
+            if journal_mode is not None:
+                connection.execute("PRAGMA journal_mode=%s" % journal_mode)
+            local.connection = connection
+        return connection
 
 
 class HDict(dict):
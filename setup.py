@@ -10,7 +10,13 @@ setup(
     description="NBA API Python wrapper",
     url="https://github.com/rozzac90/nba",
     packages=find_packages(),
+    python_requires=">=3.7",
     install_requires=[line.strip() for line in open("requirements.txt")],
+    extras_require={
+        "brotli": ["brotli"],
+        "stream": ["ijson"],
+        "fast": ["orjson", "pysimdjson"],
+    },
     long_description=open('README.md').read(),
     tests_require=['pytest'],
 )
@@ -0,0 +1,17 @@
+import pytest
+
+from nba import APIClient
+from nba.server import StandInServer
+
+
+@pytest.fixture
+def server():
+    with StandInServer(rows=5, result_sets=2) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = server.point(APIClient(cache=False))
+    yield client
+    client.close()
@@ -0,0 +1,63 @@
+import time
+
+from nba import APIClient
+from nba.cache import MemoryCache, TTLPolicy
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1, size=1)
+    cache.set("b", 2, size=1)
+    assert cache.get("a") == 1
+    cache.set("c", 3, size=1)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.entries == 2 and cache.evictions == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_entries_are_evicted_to_stay_under_max_bytes():
+    cache = MemoryCache(max_entries=None, max_bytes=10)
+    cache.set("a", 1, size=4)
+    cache.set("b", 2, size=4)
+    cache.set("a", 3, size=5)
+    assert cache.nbytes == 9 and cache.entries == 2
+    cache.set("c", 4, size=4)
+    assert cache.get("b") is None and cache.get("a") == 3
+    assert cache.nbytes == 9 and cache.evictions == 1
+    cache.set("d", 5, size=11)
+    assert cache.get("d") is None and cache.nbytes == 9
+
+
+def test_size_is_estimated_from_json():
+    cache = MemoryCache()
+    cache.set("a", {"resultSets": []})
+    assert cache.nbytes == len('{"resultSets":[]}')
+    cache.clear()
+    assert cache.entries == 0 and cache.nbytes == 0
+
+
+def test_expired_entries_are_dropped():
+    cache = MemoryCache(ttl=0.05)
+    cache.set("a", 1, size=1)
+    assert cache.get("a") == 1
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.entries == 0 and cache.nbytes == 0 and cache.misses == 1
+
+
+def test_ttl_policy_per_method():
+    cache = MemoryCache(ttl_policy=TTLPolicy(default=0, ttls={"drafthistory": 60}))
+    cache.set("a", 1, method="scoreboardV2", params={"GameDate": "2099-01-01"}, size=1)
+    cache.set("b", 2, method="commonallplayers", size=1)
+    cache.set("c", 3, method="drafthistory", size=1)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+
+def test_client_answers_repeated_calls_from_cache(server):
+    client = server.point(APIClient())
+    first = client.boxscores.traditional("0021900001", 0)
+    second = client.boxscores.traditional("0021900001", 0)
+    client.close()
+    assert server.requests == 1 and first.equals(second)
+    assert client.cache.hits == 1 and client.cache.misses == 1
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from nba import APIClient
+from nba.circuitbreaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers
+from nba.exceptions import ApiError, CircuitOpen
+from nba.retry import RetryPolicy
+
+
+def fail(breaker, times):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record(success=False)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("stats.nba.com", failure_threshold=3)
+    fail(breaker, 2)
+    breaker.before_call()
+    breaker.record(success=True)
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    assert breaker.rejected == 1
+
+
+def test_half_open_trial_closes_on_success():
+    breaker = CircuitBreaker("stats.nba.com", failure_threshold=1, recovery_timeout=0.05)
+    fail(breaker, 1)
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    breaker.record(success=True)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_trial_reopens_on_failure():
+    breaker = CircuitBreaker("stats.nba.com", failure_threshold=1, recovery_timeout=0.05)
+    fail(breaker, 1)
+    time.sleep(0.06)
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+
+
+def test_cancelled_trial_frees_its_slot():
+    breaker = CircuitBreaker("stats.nba.com", failure_threshold=1, recovery_timeout=0.05)
+    fail(breaker, 1)
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.cancel()
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_status_classes_count_as_failures():
+    breaker = CircuitBreaker("stats.nba.com", failure_status_codes=("5xx", 429))
+    assert breaker.is_failure(503) and breaker.is_failure(429)
+    assert not breaker.is_failure(404) and not breaker.is_failure(200)
+
+
+def test_client_fails_fast_once_host_is_down(server):
+    server.error_rate = 1.0
+    breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+    client = server.point(APIClient(cache=False, breakers=breakers, retry=RetryPolicy(retries=0)))
+    for _ in range(2):
+        with pytest.raises(ApiError):
+            client.boxscores.traditional("0021900001", 0)
+    with pytest.raises(CircuitOpen):
+        client.boxscores.traditional("0021900001", 0)
+    client.close()
+    assert server.requests == 2
+    assert list(breakers.states().values()) == [OPEN]
@@ -0,0 +1,78 @@
+import os
+import time
+
+import pandas as pd
+
+from nba.crawl import PickleSink, TaskQueue, work
+
+
+GAME_IDS = ["0021900001", "0021900002", "0021900003"]
+
+
+def test_lease_hands_each_task_out_once(tmp_path):
+    queue = TaskQueue(str(tmp_path / "queue.db"))
+    assert queue.plan("boxscores.traditional", game_id=GAME_IDS, idx_data=0) == 3
+    assert queue.plan("boxscores.traditional", game_id=GAME_IDS, idx_data=0) == 0
+    first = queue.lease("a", 2)
+    second = queue.lease("b", 2)
+    assert len(first) == 2 and len(second) == 1
+    assert not {task.key for task in first} & {task.key for task in second}
+    assert queue.lease("c", 2) == []
+    assert queue.counts()["leased"] == 3
+
+
+def test_expired_lease_is_handed_on(tmp_path):
+    queue = TaskQueue(str(tmp_path / "queue.db"), lease_seconds=0.05)
+    queue.plan("boxscores.traditional", game_id=GAME_IDS[:1], idx_data=0)
+    (task,) = queue.lease("a")
+    time.sleep(0.1)
+    (retaken,) = queue.lease("b")
+    assert retaken.key == task.key and retaken.attempts == 2
+    assert not queue.complete(task, "a")
+    assert not queue.extend(task, "a")
+    assert queue.complete(retaken, "b")
+    assert queue.counts()["done"] == 1
+
+
+def test_failed_task_is_retried_until_attempts_run_out(tmp_path):
+    queue = TaskQueue(str(tmp_path / "queue.db"), max_attempts=2)
+    queue.plan("boxscores.traditional", game_id=GAME_IDS[:1], idx_data=0)
+    (task,) = queue.lease("a")
+    assert queue.fail(task, "a", "boom")
+    assert queue.counts()["pending"] == 1
+    (task,) = queue.lease("a")
+    assert queue.fail(task, "a", "boom again")
+    assert queue.counts()["failed"] == 1
+    assert queue.lease("a") == []
+    assert queue.failures() == [(task.key, "boom again")]
+    assert queue.retry_failed() == 1
+    assert len(queue.lease("a")) == 1
+
+
+def test_work_drains_queue_into_sink(tmp_path, client):
+    queue = TaskQueue(str(tmp_path / "queue.db"))
+    queue.plan("boxscores.traditional", game_id=GAME_IDS, idx_data=[0, None])
+    sink = PickleSink(str(tmp_path / "frames"))
+    assert work(queue, sink, client=client, batch=4) == 6
+    assert queue.counts() == {"pending": 0, "leased": 0, "done": 6, "failed": 0}
+    results = [
+        pd.read_pickle(os.path.join(sink.directory, name)) for name in os.listdir(sink.directory)
+    ]
+    assert sum(isinstance(result, pd.DataFrame) for result in results) == 3
+    assert sum(isinstance(result, dict) for result in results) == 3
+
+
+def test_work_skips_tasks_whose_lease_moved_on(tmp_path, client):
+    queue = TaskQueue(str(tmp_path / "queue.db"), lease_seconds=0.2)
+    queue.plan("boxscores.traditional", game_id=GAME_IDS, idx_data=0)
+    fetched = []
+    traditional = client.boxscores.traditional
+
+    def slow(**kwargs):
+        fetched.append(kwargs["game_id"])
+        time.sleep(0.15)
+        return traditional(**kwargs)
+
+    client.boxscores.traditional = slow
+    assert work(queue, PickleSink(str(tmp_path / "frames")), client=client, batch=3) == 3
+    assert sorted(fetched) == GAME_IDS
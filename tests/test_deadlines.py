@@ -0,0 +1,48 @@
+import pytest
+
+from nba import APIClient, deadlines
+from nba.concurrency import AIMDController
+from nba.exceptions import DeadlineExceeded
+
+
+@pytest.mark.parametrize("timeout", [10, 2.5, None, (3.05, 30), [3.05, 30]])
+def test_any_requests_timeout_works_under_a_deadline(server, timeout):
+    client = server.point(APIClient(cache=False, timeout=timeout))
+    with deadlines.deadline(5):
+        df = client.boxscores.traditional("0021900001", 0)
+    client.close()
+    assert len(df) == 5
+
+
+def test_per_method_scalar_timeout(server):
+    client = server.point(APIClient(cache=False, timeouts={"boxscoretraditionalv2": 5}))
+    assert client.timeout_for("boxscoretraditionalv2") == (5, 5)
+    assert client.timeout_for("playbyplayv2") == (3.05, 30)
+    calls = [(client.boxscores.traditional, {"game_id": "0021900001", "idx_data": 0})]
+    assert len(client.fetch_many(calls, deadline=5)[0]) == 5
+    client.close()
+
+
+def test_request_fails_once_deadline_passed(server):
+    server.latency = 0.3
+    client = server.point(APIClient(cache=False))
+    with pytest.raises(DeadlineExceeded), deadlines.deadline(0):
+        client.boxscores.traditional("0021900001", 0)
+    client.close()
+
+
+def test_nested_deadline_never_extends_outer():
+    with deadlines.deadline(1):
+        with deadlines.deadline(10):
+            assert deadlines.remaining() <= 1
+    assert deadlines.remaining() is None
+
+
+def test_concurrency_slot_wait_is_bounded_by_deadline():
+    client = APIClient(concurrency=AIMDController(initial=1, maximum=1))
+    client.concurrency.acquire()
+    with pytest.raises(DeadlineExceeded), deadlines.deadline(0.05):
+        client.controlled(lambda: None)
+    client.concurrency.release()
+    assert client.controlled(lambda: 1) == 1
+    client.close()
@@ -0,0 +1,31 @@
+def result_set(name, value):
+    return {"name": name, "headers": ["VALUE"], "rowSet": [[value]]}
+
+
+def values(frames):
+    return {key: df["value"].tolist() for key, df in frames.items()}
+
+
+def test_every_result_set_keyed_by_name(client):
+    frames = client.boxscores.traditional("0021900001", None)
+    assert list(frames) == ["ResultSet0", "ResultSet1"]
+    assert all(len(df) == 5 for df in frames.values())
+
+
+def test_duplicate_and_missing_names_are_keyed_by_index(client):
+    payload = {
+        "resultSets": [
+            result_set("Stats", 1),
+            result_set("Stats", 2),
+            result_set(None, 3),
+            {"headers": ["VALUE"], "rowSet": [[4]]},
+        ]
+    }
+    frames = client.boxscores.process_response(payload, None, "resultSets")
+    assert values(frames) == {"Stats": [1], 1: [2], 2: [3], 3: [4]}
+
+
+def test_singular_result_set_dict(client):
+    payload = {"resultSet": result_set("LeagueLeaders", 1)}
+    frames = client.player.process_response(payload, None, "resultSet")
+    assert values(frames) == {"LeagueLeaders": [1]}
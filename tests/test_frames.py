@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from nba.frames import build_frame
+
+COLUMNS = {
+    "ints": [1, 2, 3],
+    "ints with nulls": [1, None, 3],
+    "floats with nulls": [0.456, None, 0.5],
+    "ints and floats": [1, 2.5, 3],
+    "bools": [True, False, True],
+    "strings": ["34:12", None, "20:00"],
+    "mixed": [1, "a", None],
+    "beyond int64": [2 ** 64, 1, 2],
+    "nested": [[1, 2], [], {"a": 1}],
+    "nulls": [None, None, None],
+}
+
+
+@pytest.mark.parametrize("values", list(COLUMNS.values()), ids=list(COLUMNS))
+def test_dtypes_match_pandas(values):
+    rows = [[value, idx] for idx, value in enumerate(values)]
+    expected = pd.DataFrame(rows, columns=["value", "idx"])
+    assert_frame_equal(build_frame(["value", "idx"], rows=rows), expected)
+    assert_frame_equal(build_frame(["value", "idx"], columns=[values, [0, 1, 2]]), expected)
+
+
+def test_empty_and_ragged_rows_are_left_to_pandas():
+    headers = ["a", "b", "c"]
+    assert_frame_equal(build_frame(headers, rows=[]), pd.DataFrame([], columns=headers))
+    rows = [[1, 2, 3], [4, 5]]
+    assert_frame_equal(build_frame(headers, rows=rows), pd.DataFrame(rows, columns=headers))
+
+
+def test_columns_no_row_reached_are_filled_with_nulls():
+    df = build_frame(["a", "b"], columns=[[1, 2]])
+    assert_frame_equal(df, pd.DataFrame([[1, None], [2, None]], columns=["a", "b"]))
@@ -0,0 +1,26 @@
+from nba import APIClient
+from nba.hedging import HedgePolicy
+
+
+def warmed_up(hedge):
+    for _ in range(hedge.min_samples):
+        hedge.observe("boxscoretraditionalv2", 1.0)
+    return hedge
+
+
+def test_close_stops_hedging_threads_the_client_created(server):
+    client = server.point(APIClient(cache=False, hedge=True))
+    warmed_up(client.hedge)
+    client.boxscores.traditional("0021900001", 0)
+    assert client.hedge._executor is not None
+    client.close()
+    assert client.hedge._executor is None
+
+
+def test_close_leaves_a_hedge_policy_passed_in_running(server):
+    hedge = warmed_up(HedgePolicy())
+    client = server.point(APIClient(cache=False, hedge=hedge))
+    client.boxscores.traditional("0021900001", 0)
+    client.close()
+    assert hedge._executor is not None
+    hedge.close()
@@ -0,0 +1,72 @@
+import pytest
+
+from nba.exceptions import CircuitOpen
+from nba.jobs import DONE, FileCheckpoint, Job, SQLiteCheckpoint
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def checkpoint_factory(request, tmp_path):
+    if request.param == "file":
+        return lambda: FileCheckpoint(str(tmp_path / "job.jsonl"))
+    return lambda: SQLiteCheckpoint(str(tmp_path / "job.db"), job="shots")
+
+
+def flaky(fail_on):
+    seen = []
+
+    def func(unit):
+        seen.append(unit)
+        if unit in fail_on:
+            raise ValueError(unit)
+
+    return func, seen
+
+
+def test_rerun_only_does_unfinished_units(checkpoint_factory):
+    func, seen = flaky({3})
+    failures = Job(range(5), func, checkpoint_factory()).run()
+    assert list(failures) == ["3"] and seen == [0, 1, 2, 3, 4]
+
+    func, seen = flaky(set())
+    job = Job(range(6), func, checkpoint_factory())
+    assert job.run() == {}
+    assert seen == [3, 5]
+    assert job.skipped == 4 and job.completed == 2
+
+
+def test_only_failed_skips_units_never_tried(checkpoint_factory):
+    func, _ = flaky({1})
+    Job(range(3), func, checkpoint_factory()).run()
+    func, seen = flaky(set())
+    Job(range(5), func, checkpoint_factory()).run(only_failed=True)
+    assert seen == [1]
+    assert checkpoint_factory().failures() == {}
+
+
+def test_abort_keeps_finished_units(checkpoint_factory):
+    def func(unit):
+        if unit == 2:
+            raise CircuitOpen("stats.nba.com", 30)
+
+    with pytest.raises(CircuitOpen):
+        Job(range(4), func, checkpoint_factory()).run()
+    checkpoint = checkpoint_factory()
+    assert checkpoint.done("0") and checkpoint.done("1")
+    assert not checkpoint.done("2") and checkpoint.failures() == {}
+
+
+def test_file_checkpoint_path_is_accepted(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    Job(["a"], lambda unit: None, path).run()
+    assert FileCheckpoint(path).status == {"a": DONE}
+
+
+def test_file_checkpoint_drops_torn_last_line(tmp_path):
+    path = str(tmp_path / "job.jsonl")
+    FileCheckpoint(path).record("a", DONE)
+    with open(path, "a") as f:
+        f.write('{"unit": "b", "sta')
+    checkpoint = FileCheckpoint(path)
+    assert checkpoint.status == {"a": DONE}
+    checkpoint.record("c", DONE)
+    assert FileCheckpoint(path).status == {"a": DONE, "c": DONE}
@@ -0,0 +1,18 @@
+import pytest
+import requests
+
+from nba import APIClient
+from nba.retry import RetryPolicy
+from nba.server import StandInServer
+
+
+def test_failed_attempts_are_counted():
+    with StandInServer() as server:
+        client = server.point(APIClient(cache=False, metrics=True, retry=RetryPolicy(retries=0)))
+    with pytest.raises(requests.ConnectionError):
+        client.boxscores.traditional("0021900001", 0)
+    client.close()
+    text = client.metrics()
+    labels = 'endpoint="Boxscores.traditional",method="boxscoretraditionalv2"'
+    assert 'nba_requests_total{%s,status="error"} 1' % labels in text
+    assert 'nba_stage_duration_seconds_count{endpoint="Boxscores.traditional",stage="http"} 1' in text
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from nba import APIClient
+from nba.ratelimit import SQLiteTokenBucket, TokenBucket
+
+
+def test_bucket_allows_burst_up_to_capacity():
+    bucket = TokenBucket(rate=1, capacity=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+
+def test_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    assert bucket.try_acquire()
+    start = time.monotonic()
+    assert bucket.acquire()
+    assert 0.01 < time.monotonic() - start < 0.1
+
+
+def test_acquire_gives_up_after_timeout():
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.try_acquire()
+    assert not bucket.acquire(timeout=0.05)
+
+
+def test_bucket_rejects_impossible_requests():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=2).acquire(tokens=3)
+
+
+def test_sqlite_buckets_share_tokens(tmp_path):
+    path = str(tmp_path / "buckets.db")
+    first = SQLiteTokenBucket(path, rate=1, capacity=2)
+    second = SQLiteTokenBucket(path, rate=1, capacity=2)
+    other = SQLiteTokenBucket(path, rate=1, capacity=2, name="cdn.nba.com")
+    assert first.try_acquire() and second.try_acquire()
+    assert not first.try_acquire() and not second.try_acquire()
+    assert other.try_acquire()
+
+
+def test_client_stays_under_server_limit(server):
+    server.limiter = TokenBucket(20)
+    client = server.point(APIClient(cache=False, rate_limiter=TokenBucket(rate=15, capacity=1)))
+    calls = [
+        (client.boxscores.traditional, {"game_id": "00219000%02d" % idx, "idx_data": 0})
+        for idx in range(10)
+    ]
+    client.fetch_many(calls)
+    client.close()
+    assert server.requests == 10
+    assert server.throttled == 0
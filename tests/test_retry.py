@@ -0,0 +1,75 @@
+import email.utils
+import time
+
+import pytest
+import requests
+
+from nba import APIClient
+from nba.exceptions import ApiError
+from nba.ratelimit import TokenBucket
+from nba.retry import RetryBudget, RetryPolicy
+
+
+def response(status_code, retry_after=None):
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+def test_budget_limits_retries_to_share_of_requests():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, window=10)
+    for _ in range(4):
+        budget.record_request()
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+def test_budget_allows_minimum_retries_without_traffic():
+    budget = RetryBudget(ratio=0, min_per_second=0.2, window=10)
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+
+def test_only_retryable_statuses_are_retried():
+    policy = RetryPolicy(retries=2)
+    assert policy.should_retry(0, response(503))
+    assert policy.should_retry(0, response(429))
+    assert policy.should_retry(0)
+    assert not policy.should_retry(0, response(404))
+    assert not policy.should_retry(2, response(503))
+
+
+def test_retry_after_seconds_is_respected_and_capped():
+    policy = RetryPolicy(max_backoff=5)
+    assert policy.delay(0, response(429, "2")) == 2
+    assert policy.delay(0, response(429, "120")) == 5
+    assert RetryPolicy(respect_retry_after=False, jitter=False).delay(0, response(429, "2")) == 0.5
+
+
+def test_retry_after_http_date():
+    retry_at = email.utils.formatdate(time.time() + 3, usegmt=True)
+    assert 1 < RetryPolicy().delay(0, response(503, retry_at)) <= 3
+    assert RetryPolicy(jitter=False).delay(1, response(503, "soon")) == 1.0
+
+
+def test_client_waits_out_throttling(server):
+    server.limiter = TokenBucket(rate=2, capacity=1)
+    client = server.point(APIClient(cache=False, retry=RetryPolicy(retries=1)))
+    client.boxscores.traditional("0021900001", 0)
+    start = time.monotonic()
+    client.boxscores.traditional("0021900002", 0)
+    client.close()
+    # the stand-in answers 429 with Retry-After: 1.
+    assert server.throttled == 1 and server.requests == 3
+    assert time.monotonic() - start >= 1
+
+
+def test_client_stops_retrying_once_budget_is_spent(server):
+    server.error_rate = 1.0
+    budget = RetryBudget(ratio=0, min_per_second=0.1, window=10)
+    retry = RetryPolicy(retries=3, backoff=0, budget=budget)
+    client = server.point(APIClient(cache=False, retry=retry))
+    with pytest.raises(ApiError):
+        client.boxscores.traditional("0021900001", 0)
+    client.close()
+    assert server.requests == 2
@@ -0,0 +1,96 @@
+import contextvars
+import threading
+import time
+
+from nba import scheduler
+from nba.ratelimit import TokenBucket
+from nba.scheduler import BACKFILL, INTERACTIVE, LIVE, PriorityScheduler
+
+
+def test_higher_priority_is_served_first():
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.try_acquire()
+    limiter = PriorityScheduler(bucket)
+    order = []
+    lock = threading.Lock()
+
+    def request(level, name):
+        with scheduler.priority(level):
+            limiter.acquire()
+        with lock:
+            order.append(name)
+
+    threads = []
+    requests = [
+        (BACKFILL, "backfill-1"),
+        (BACKFILL, "backfill-2"),
+        (INTERACTIVE, "interactive"),
+        (LIVE, "live"),
+    ]
+    for level, name in requests:
+        thread = threading.Thread(target=request, args=(level, name))
+        thread.start()
+        threads.append(thread)
+        # queue the requests in a known order before the first token frees up.
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+    assert order == ["live", "interactive", "backfill-1", "backfill-2"]
+    assert limiter.granted == {LIVE: 1, INTERACTIVE: 1, BACKFILL: 2}
+
+
+def test_try_acquire_does_not_jump_the_queue():
+    bucket = TokenBucket(rate=5, capacity=1)
+    bucket.try_acquire()
+    limiter = PriorityScheduler(bucket)
+    with scheduler.priority(LIVE):
+        waiter = threading.Thread(target=contextvars.copy_context().run, args=(limiter.acquire,))
+    waiter.start()
+    time.sleep(0.01)
+    assert limiter.waiting[LIVE] == 1
+    with scheduler.priority(BACKFILL):
+        assert not limiter.try_acquire()
+    waiter.join()
+    assert limiter.waiting[LIVE] == 0
+
+
+def test_acquire_times_out_and_leaves_the_queue():
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.try_acquire()
+    limiter = PriorityScheduler(bucket)
+    assert not limiter.acquire(timeout=0.05)
+    assert sum(limiter.waiting.values()) == 0
+
+
+def test_priority_names_and_nesting():
+    assert scheduler.current() == INTERACTIVE
+    with scheduler.priority("backfill"):
+        assert scheduler.current() == BACKFILL
+        with scheduler.priority(None):
+            assert scheduler.current() == BACKFILL
+    assert scheduler.current() == INTERACTIVE
+
+
+class SlowLimiter(object):
+    def __init__(self, delay):
+        self.delay = delay
+        self.entered = threading.Event()
+
+    def try_acquire(self, tokens=1):
+        self.entered.set()
+        time.sleep(self.delay)
+        return True
+
+
+def test_limiter_is_called_without_holding_the_lock():
+    bucket = SlowLimiter(0.5)
+    limiter = PriorityScheduler(bucket)
+    holder = threading.Thread(target=limiter.acquire)
+    holder.start()
+    bucket.entered.wait()
+    start = time.monotonic()
+    assert limiter.waiting[INTERACTIVE] == 1
+    assert not limiter.acquire(timeout=0.05)
+    assert time.monotonic() - start < 0.3
+    holder.join()
+    assert limiter.granted[INTERACTIVE] == 1 and sum(limiter.waiting.values()) == 0
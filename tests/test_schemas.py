@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from nba import APIClient
+from nba.schemas import SchemaRegistry
+
+
+def frame(**columns):
+    return pd.DataFrame(columns)
+
+
+def test_nullable_ids_keep_their_values():
+    df = frame(team_id=[1610612737.0, 1610612766.0, np.nan])
+    df = SchemaRegistry().apply(df, "leaguegamelog", "LeagueGameLog")
+    assert str(df["team_id"].dtype) == "Int32"
+    assert df["team_id"].tolist()[:2] == [1610612737, 1610612766]
+    assert df["team_id"].isna().tolist() == [False, False, True]
+
+
+def test_percentages_become_float32():
+    df = frame(fg_pct=[0.456, 0.5, 0.333, np.nan], ft_pct=[0.857, 1.0, 0.0, 0.714])
+    registry = SchemaRegistry()
+    assert registry.dtypes_for("leaguegamelog", "LeagueGameLog", df) == {
+        "fg_pct": "float32",
+        "ft_pct": "float32",
+    }
+    df = registry.apply(df, "leaguegamelog", "LeagueGameLog")
+    assert str(df["fg_pct"].dtype) == "float32"
+    assert np.allclose(df["fg_pct"], [0.456, 0.5, 0.333, np.nan], equal_nan=True)
+
+
+def test_floats_losing_precision_stay_float64():
+    df = frame(points=[16777217.0, 2.0, np.nan], tiny=[1e-50, 0.5, 0.25], ratio=[1e39, 1.0, 2.0])
+    assert SchemaRegistry().dtypes_for("leaguegamelog", "LeagueGameLog", df) == {}
+
+
+def test_declared_float32_is_refused_when_lossy():
+    df = frame(pts=[16777217.0, 2.0])
+    registry = SchemaRegistry({("leaguegamelog", "LeagueGameLog"): {"pts": "float32"}})
+    df = registry.apply(df, "leaguegamelog", "LeagueGameLog")
+    assert df["pts"].dtype == np.float64 and df["pts"][0] == 16777217
+
+
+def test_ints_and_labels_are_compacted():
+    df = frame(player_id=[201939, 2544], team_abbreviation=["GSW", "LAL"], pts=[30, 25])
+    df = SchemaRegistry().apply(df, "leaguegamelog", "LeagueGameLog")
+    assert df.dtypes.astype(str).to_dict() == {
+        "player_id": "int32",
+        "team_abbreviation": "category",
+        "pts": "int32",
+    }
+
+
+def test_compact_client_frames(server):
+    client = server.point(APIClient(cache=False, compact=True))
+    df = client.boxscores.traditional("0021900001", 0)
+    client.close()
+    assert str(df["player_id"].dtype) == "int32"
+    assert str(df["team_abbreviation"].dtype) == "category"
@@ -0,0 +1,40 @@
+import threading
+
+from nba import APIClient
+from nba.sessions import SessionRegistry
+
+
+def test_threads_get_own_sessions_sharing_one_adapter():
+    registry = SessionRegistry()
+    url = "http://stats.nba.com/stats/boxscoretraditionalv2"
+    sessions = []
+    threads = [
+        threading.Thread(target=lambda: sessions.append(registry.session_for(url)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(map(id, sessions))) == 3
+    adapters = set(id(session.get_adapter(url)) for session in sessions)
+    assert adapters == {id(registry.adapter_for("stats.nba.com"))}
+    assert registry.session_for(url) is registry.session_for(url)
+    registry.close()
+
+
+def test_batches_reuse_pooled_connections(server):
+    server.latency = 0.02
+    client = server.point(APIClient(cache=False, max_workers=4))
+    adapter = client.sessions.adapter_for(server.url.split("//")[1])
+    pools = adapter.poolmanager.pools
+    for batch in range(3):
+        game_ids = ["00219%05d" % (batch * 10 + idx) for idx in range(8)]
+        calls = [
+            (client.boxscores.traditional, {"game_id": game_id, "idx_data": 0})
+            for game_id in game_ids
+        ]
+        client.fetch_many(calls)
+        (key,) = pools.keys()
+        assert 0 < pools[key].num_connections <= 4
+    client.close()
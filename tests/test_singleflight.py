@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from nba import APIClient, deadlines
+from nba.exceptions import DeadlineExceeded
+from nba.singleflight import SingleFlight
+
+
+def run_concurrently(func, count):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(func())
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_duplicates_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"rows": 1}
+
+    results, errors = run_concurrently(lambda: flight.do("key", fetch), 5)
+    assert errors == []
+    assert len(calls) == 1 and flight.coalesced == 4
+    assert all(result is results[0] for result in results)
+
+
+def test_error_is_raised_in_every_duplicate():
+    flight = SingleFlight()
+
+    def fetch():
+        time.sleep(0.1)
+        raise ValueError("down")
+
+    results, errors = run_concurrently(lambda: flight.do("key", fetch), 3)
+    assert results == [] and len(errors) == 3
+    assert all(isinstance(error, ValueError) for error in errors)
+
+
+def test_later_call_runs_again():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    assert flight.coalesced == 0
+
+
+def test_duplicate_waits_no_longer_than_deadline():
+    flight = SingleFlight()
+    leader = threading.Thread(target=flight.do, args=("key", time.sleep, 0.5))
+    leader.start()
+    time.sleep(0.05)
+    with deadlines.deadline(0.05), pytest.raises(DeadlineExceeded):
+        flight.do("key", time.sleep, 0.5)
+    leader.join()
+
+
+def test_client_coalesces_identical_requests(server):
+    server.latency = 0.1
+    client = server.point(APIClient(cache=False))
+    calls = [(client.boxscores.traditional, {"game_id": "0021900001", "idx_data": 0})] * 4
+    frames = client.fetch_many(calls)
+    client.close()
+    assert server.requests == 1
+    assert all(frame.equals(frames[0]) for frame in frames)
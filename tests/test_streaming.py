@@ -0,0 +1,63 @@
+import io
+import json
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from nba import APIClient
+from nba.streaming import CountingReader, parse_result_sets
+
+pytest.importorskip("ijson")
+
+HEADERS = ["GAME_ID", "PLAYER_ID", "MIN", "FG_PCT", "STARTER", "TAGS"]
+ROWS = [
+    ["0021900001", 201939, "34:12", 0.456, True, ["A", "B"]],
+    ["0021900001", 2544, None, None, False, {"note": [1, 2]}],
+    ["0021900001", 203507, "12:01"],
+    ["0021900001", 1628369, "20:00", 0.5, True, []],
+]
+PAYLOADS = {
+    "nested cells and short rows": {
+        "resultSets": [
+            {"name": "PlayerStats", "headers": HEADERS, "rowSet": ROWS},
+            {"name": "Empty", "headers": HEADERS, "rowSet": []},
+        ]
+    },
+    "singular resultSet dict": {"resultSet": {"name": "LeagueLeaders", "headers": HEADERS, "rowSet": ROWS}},
+    "singular resultSet list": {
+        "resultSet": [{"headers": HEADERS, "rowSet": ROWS[:2]}, {"headers": HEADERS, "rowSet": ROWS[2:]}]
+    },
+}
+
+
+def assert_frames_equal(streamed, parsed):
+    if not isinstance(parsed, dict):
+        streamed, parsed = {0: streamed}, {0: parsed}
+    assert list(streamed) == list(parsed)
+    for name in parsed:
+        assert_frame_equal(streamed[name], parsed[name])
+
+
+@pytest.mark.parametrize("payload", list(PAYLOADS.values()), ids=list(PAYLOADS))
+def test_streamed_frames_match_rowset_frames(client, payload):
+    (result_name,) = payload
+    reader = CountingReader(io.BytesIO(json.dumps(payload).encode()))
+    streamed = parse_result_sets(reader)
+    assert reader.nbytes == len(json.dumps(payload))
+    endpoint = client.boxscores
+    assert_frames_equal(
+        endpoint.process_response(streamed, None, result_name),
+        endpoint.process_response(payload, None, result_name),
+    )
+
+
+def test_stream_client_matches_default_client(server, client):
+    streaming = server.point(APIClient(cache=False, stream=True))
+    calls = [
+        lambda c: c.boxscores.traditional("0021900001", None),
+        lambda c: c.player.all_ranked_stats(),
+        lambda c: c.homepage.leaders_tiles(None),
+    ]
+    for call in calls:
+        assert_frames_equal(call(streaming), call(client))
+    streaming.close()